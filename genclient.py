@@ -0,0 +1,42 @@
+from typing import List, Optional
+from json import dumps, loads
+from os import getcwd
+from socket import AF_UNIX, SHUT_WR, SOCK_STREAM, socket
+from sys import stderr
+
+
+def server(argv: List[str]) -> Optional[str]:
+    for index, arg in enumerate(argv):
+        if arg == "--":
+            break
+
+        if arg == "--server" and index + 1 < len(argv):
+            return argv[index + 1]
+
+        if arg.startswith("--server="):
+            return arg[len("--server=") :]
+
+    return None
+
+
+def forward(path: str, tool: str, argv: List[str]) -> int:
+    request = {"tool": tool, "argv": argv, "cwd": getcwd()}
+
+    try:
+        with socket(AF_UNIX, SOCK_STREAM) as connection:
+            connection.connect(path)
+            connection.sendall((dumps(request) + "\n").encode())
+            connection.shutdown(SHUT_WR)
+
+            with connection.makefile("rb") as stream:
+                response = loads(stream.read())
+
+        output, status = response["output"], response["status"]
+
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"FailedError: Forward Failed: server({path}): {e}", file=stderr)
+        return 1
+
+    print(output, end="")
+
+    return status
@@ -0,0 +1,162 @@
+from typing import Callable, Dict, Final, List, Tuple
+from argparse import ArgumentParser
+from asyncio import StreamReader, StreamWriter, get_running_loop, run, start_unix_server
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from multiprocessing import get_context
+from json import dumps, loads
+from os import chdir, cpu_count, lstat, remove, umask
+from os.path import lexists
+from signal import SIGTERM, signal
+from stat import S_ISSOCK
+from sys import exit
+from traceback import print_exc
+
+import reggen, memgen, pktgen
+from inc import Str, InvalidError
+
+Tools: Final[Dict[str, Callable[[List[str], bool], None]]] = {
+    "reggen": reggen.main,
+    "memgen": memgen.main,
+    "pktgen": pktgen.main,
+}
+
+
+def job(tool: str, argv: List[str], cwd: str) -> Tuple[int, str]:
+    output = StringIO()
+    status = 0
+
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            chdir(cwd)
+            Tools[tool](argv, True)
+
+        except SystemExit as e:
+            if isinstance(e.code, int) or e.code is None:
+                status = e.code or 0
+
+            else:
+                print(e.code)
+                status = 1
+
+        except Exception:
+            print_exc()
+            status = 1
+
+    return status, output.getvalue()
+
+
+class Pool:
+    def __init__(self, jobs: int) -> None:
+        self._jobs: int = jobs
+        self._executor: ProcessPoolExecutor = self._create()
+
+    async def run(self, tool: str, argv: List[str], cwd: str) -> Tuple[int, str]:
+        executor = self._executor
+
+        try:
+            return await get_running_loop().run_in_executor(
+                executor, job, tool, argv, cwd
+            )
+
+        except BrokenProcessPool:
+            if executor is self._executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create()
+            raise
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def _create(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(self._jobs, mp_context=get_context("spawn"))
+
+
+async def handle(reader: StreamReader, writer: StreamWriter, pool: Pool) -> None:
+    try:
+        request = loads(await reader.read())
+
+        if (tool := request["tool"]) not in Tools:
+            status, output = 2, f"tool({tool}) should be one of {', '.join(Tools)}\n"
+
+        else:
+            status, output = await pool.run(tool, list(request["argv"]), request["cwd"])
+
+    except (ValueError, KeyError, TypeError) as e:
+        status, output = 2, f"invalid request: {e}\n"
+
+    except Exception as e:
+        status, output = 1, f"server failed: {type(e).__name__}: {e}\n"
+
+    try:
+        writer.write((dumps({"status": status, "output": output}) + "\n").encode())
+        await writer.drain()
+
+        writer.close()
+        await writer.wait_closed()
+
+    except ConnectionError:
+        pass
+
+
+def is_socket(path: str) -> bool:
+    try:
+        return S_ISSOCK(lstat(path).st_mode)
+
+    except FileNotFoundError:
+        return False
+
+
+async def serve(path: str, jobs: int) -> None:
+    pool = Pool(jobs)
+
+    try:
+        mask = umask(0o077)
+
+        try:
+            server = await start_unix_server(
+                lambda reader, writer: handle(reader, writer, pool), path
+            )
+
+        finally:
+            umask(mask)
+
+        async with server:
+            await server.serve_forever()
+
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+
+    # fmt: off
+    parser.add_argument("Socket", type=str, help="server socket path")
+
+    parser.add_argument("-j", "--jobs", default=cpu_count() or 1, type=int, help="concurrent generation jobs")
+    # fmt: on
+
+    args = parser.parse_args()
+
+    if lexists(args.Socket):
+        if not is_socket(args.Socket):
+            raise InvalidError("Socket", args.Socket, "path exists and is not a socket")
+
+        remove(args.Socket)
+
+    Str(f"Generation Server on {args.Socket}").add_guard("=").print()
+
+    signal(SIGTERM, lambda *_: exit(0))
+
+    try:
+        run(serve(args.Socket, args.jobs))
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        if is_socket(args.Socket):
+            remove(args.Socket)
@@ -0,0 +1,128 @@
+from typing import Any, Iterator, List, Optional, Tuple
+from abc import ABC, abstractmethod
+
+from inc.Exceptions import NotExpectedError
+from inc.HexStr import HexStr
+from inc.ArrayRange import ArrayRange
+
+
+class ArrayBase(ABC):
+    __slots__ = ("_name", "_ranges", "_table", "_step", "_segments", "_finalized")
+
+    def __init__(self, name: str, ranges: Optional[List[ArrayRange]] = None) -> None:
+        self._name: str = name
+        self._ranges: List[ArrayRange] = ranges if ranges is not None else []
+
+        self._table: Optional[List[Optional[int]]] = None
+        self._step: Optional[Tuple[HexStr, Optional[HexStr], Optional[int]]] = None
+        self._segments: List[ArrayRange] = []
+        self._finalized: bool = False
+
+    def __contains__(self, index: int) -> bool:
+        return any(index in range_ for range_ in self._ranges)
+
+    @abstractmethod
+    def _element(self, index: int, value: int) -> Any:
+        pass
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def ranges(self) -> List[ArrayRange]:
+        return self._ranges
+
+    @property
+    def elements(self) -> Iterator[Tuple[int, int]]:
+        return ArrayRange.merge(self._ranges)
+
+    @property
+    def first(self) -> Any:
+        range_ = self._ranges[0]
+
+        return self._element(range_.start, range_.base)
+
+    @property
+    def indexes(self) -> List[int]:
+        return sorted(index for range_ in self._ranges for index in range_.indexes)
+
+    @property
+    def number(self) -> int:
+        return max(range_.end for range_ in self._ranges)
+
+    @property
+    def table(self) -> List[Optional[int]]:
+        if self._table is not None:
+            return self._table
+
+        table: List[Optional[int]] = [None] * self.number
+        for range_ in self._ranges:
+            for index, value in range_:
+                table[index] = value
+
+        if self._finalized:
+            self._table = table
+
+        return table
+
+    @property
+    def gaps(self) -> List[Tuple[int, int]]:
+        gaps: List[Tuple[int, int]] = []
+
+        for index, value in enumerate(self.table):
+            if value is not None:
+                continue
+
+            if gaps and gaps[-1][1] == index:
+                gaps[-1] = gaps[-1][0], index + 1
+
+            else:
+                gaps.append((index, index + 1))
+
+        return gaps
+
+    @property
+    def step(self) -> Optional[Tuple[HexStr, Optional[HexStr], Optional[int]]]:
+        return self._step if self._finalized else self._stride()
+
+    @property
+    def segments(self) -> List[ArrayRange]:
+        return self._segments if self._finalized else ArrayRange.segments(self._ranges)
+
+    def _stride(self) -> Optional[Tuple[HexStr, Optional[HexStr], Optional[int]]]:
+        if not self._ranges:
+            return None
+
+        if sum(range_.count for range_ in self._ranges) == 1:
+            return HexStr.from_int(self._ranges[0].base), None, None
+
+        if (stride := ArrayRange.stride(self._ranges)) is None:
+            return None
+
+        base, step = stride
+
+        return (
+            (HexStr.from_int(base), HexStr.from_int(step), step.bit_length() - 1)
+            if (step & (step - 1)) == 0
+            else (HexStr.from_int(base), HexStr.from_int(step), None)
+        )
+
+    def get(self, index: int) -> Optional[Any]:
+        for range_ in self._ranges:
+            if (value := range_.get(index)) is not None:
+                return self._element(index, value)
+
+        return None
+
+    def extend(self, ranges: List[ArrayRange]) -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Array({self._name}): already finalized")
+
+        self._ranges.extend(ranges)
+
+    def finalize(self) -> None:
+        self._ranges.sort(key=lambda range_: range_.base)
+        self._step = self._stride()
+        self._segments = ArrayRange.segments(self._ranges)
+        self._finalized = True
@@ -0,0 +1,180 @@
+from typing import Callable, Iterator, List, Optional, Tuple
+from heapq import merge
+
+from inc.HexStr import HexStr
+
+
+class ArrayRange:
+    __slots__ = ("_base", "_start", "_count", "_step")
+
+    def __init__(self, base: int, start: int, count: int, step: int) -> None:
+        self._base: int = base
+        self._start: int = start
+        self._count: int = count
+        self._step: int = step
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, index: int) -> bool:
+        return self._start <= index < self._start + self._count
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for index in range(self._start, self._start + self._count):
+            yield index, self._base + self._step * (index - self._start)
+
+    @property
+    def base(self) -> int:
+        return self._base
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def step(self) -> int:
+        return self._step
+
+    @property
+    def indexes(self) -> range:
+        return range(self._start, self._start + self._count)
+
+    @property
+    def end(self) -> int:
+        return self._start + self._count
+
+    def get(self, index: int) -> Optional[int]:
+        return (
+            self._base + self._step * (index - self._start) if index in self else None
+        )
+
+    def overlaps(self, other: "ArrayRange") -> bool:
+        return self._start < other.end and other.start < self.end
+
+    @staticmethod
+    def merge(ranges: List["ArrayRange"]) -> Iterator[Tuple[int, int]]:
+        return merge(*ranges, key=lambda element: element[1])
+
+    @staticmethod
+    def stride(ranges: List["ArrayRange"]) -> Optional[Tuple[int, int]]:
+        steps = {range_.step for range_ in ranges if 1 < range_.count}
+
+        if 1 < len(steps):
+            return None
+
+        if steps:
+            step = steps.pop()
+
+        else:
+            (value, index), (next_value, next_index) = sorted(
+                (range_.base, range_.start) for range_ in ranges
+            )[:2]
+
+            values = next_value - value
+            indexes = next_index - index
+
+            if values * indexes <= 0 or values % indexes:
+                return None
+
+            step = values // indexes
+
+        if step <= 0:
+            return None
+
+        base = ranges[0].base - (step * ranges[0].start)
+
+        if any(base != (range_.base - (step * range_.start)) for range_ in ranges):
+            return None
+
+        return base, step
+
+    @staticmethod
+    def segments(ranges: List["ArrayRange"]) -> List["ArrayRange"]:
+        segments: List[ArrayRange] = []
+
+        for range_ in sorted(ranges, key=lambda range_: range_.start):
+            if not range_.count:
+                continue
+
+            if segments and (step := segments[-1].collinear(range_)) is not None:
+                segment = segments.pop()
+                range_ = ArrayRange(
+                    segment.base, segment.start, range_.end - segment.start, step
+                )
+
+            segments.append(range_)
+
+        return segments
+
+    @staticmethod
+    def segmented(
+        segments: List["ArrayRange"], index: str, address: Callable[[int], str]
+    ) -> str:
+        terms = []
+
+        for segment in segments:
+            base = address(segment.base)
+            shifted = index if segment.start == 0 else f"( {index} - {segment.start} )"
+
+            if segment.count == 1:
+                terms.append(base)
+
+            elif (segment.step & (segment.step - 1)) == 0:
+                terms.append(
+                    f"{base} + ( {shifted} << {segment.step.bit_length() - 1} )"
+                )
+
+            else:
+                terms.append(
+                    f"{base} + ( {shifted} * {HexStr.from_int(segment.step)} )"
+                )
+
+        return (
+            "".join(
+                f"{index} < {following.start} ? ( {term} ) : "
+                for term, following in zip(terms, segments[1:])
+            )
+            + f"( {terms[-1]} )"
+        )
+
+    @staticmethod
+    def undefined(gaps: List[Tuple[int, int]]) -> str:
+        return (
+            "// UNDEFINED "
+            + ", ".join(
+                str(start) if end - start == 1 else f"{start}..{end - 1}"
+                for start, end in gaps
+            )
+            if gaps
+            else ""
+        )
+
+    def collinear(self, other: "ArrayRange") -> Optional[int]:
+        indexes = other.start - self._start
+        values = other.base - self._base
+
+        if 1 < self._count:
+            step = self._step
+
+        elif 1 < other.count:
+            step = other.step
+
+        elif indexes <= 0 or values % indexes:
+            return None
+
+        else:
+            step = values // indexes
+
+        if (
+            step <= 0
+            or indexes <= 0
+            or values != step * indexes
+            or (1 < other.count and other.step != step)
+        ):
+            return None
+
+        return step
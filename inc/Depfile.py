@@ -0,0 +1,23 @@
+from typing import List
+
+from inc.WriteFile import WriteFile
+
+
+class Depfile:
+    def __init__(self, path: str) -> None:
+        self._file: WriteFile = WriteFile(path)
+
+    @property
+    def path(self) -> str:
+        return self._file.path
+
+    def write(self, targets: List[str], dependencies: List[str]) -> None:
+        self._file.write(
+            " ".join(self._escape(target) for target in targets)
+            + ": "
+            + " ".join(self._escape(dependency) for dependency in dependencies)
+            + "\n"
+        )
+
+    def _escape(self, path: str) -> str:
+        return path.replace(" ", "\\ ").replace("#", "\\#").replace("$", "$$")
@@ -1,40 +1,65 @@
+from functools import lru_cache
+from re import compile
+
 from inc.Exceptions import InvalidError
 
+_pattern = compile(r"0[xX][0-9a-fA-F]+")
+
 
 class HexStr(str):
+    __slots__ = ("_value",)
+
+    _value: int
+
     def __new__(cls, value: str):
+        if type(value) is cls:
+            return value
+
         if not cls.is_HexStr(value):
             raise InvalidError("HexStr", value, "impossible to be hexadecimal")
 
-        return super().__new__(cls, value)
+        hex_str = super().__new__(cls, value)
+        hex_str._value = int(value, 16)
+
+        return hex_str
 
     @classmethod
     def is_HexStr(cls, value: str) -> bool:
-        return (
-            3 <= len(value)
-            and value.lower().startswith("0x")
-            and all(c in "0123456789abcdefABCDEF" for c in value[2:])
-        )
+        return _pattern.fullmatch(value) is not None
 
     @classmethod
+    @lru_cache(maxsize=1 << 16)
     def from_int(cls, value: int) -> "HexStr":
         return HexStr(f"0x{value:X}")
 
     @property
     def value(self) -> int:
-        return int(self, 16)
+        return self._value
 
     def get_aligned(self, align: int) -> "HexStr":
-        num = self[2:]
+        return HexStr._aligned(self, align)
+
+    def get_wrapped(self, wrapper: str, align: int) -> str:
+        return HexStr._wrapped(self, wrapper, align)
+
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
+    def _aligned(hex_str: "HexStr", align: int) -> "HexStr":
+        num = hex_str[2:]
 
         if len(num) < align:
             num = num.zfill(align)
 
         elif len(num) > align:
             trim = len(num) - align
-            if any(c != "0" for c in num[:trim]):
-                raise InvalidError("Align", str(align), f"{self} can not be aligned")
+            if num[:trim].lstrip("0"):
+                raise InvalidError("Align", str(align), f"{hex_str} can not be aligned")
 
             num = num[trim:]
 
         return HexStr(f"0x{num}")
+
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
+    def _wrapped(hex_str: "HexStr", wrapper: str, align: int) -> str:
+        return f"{wrapper}({HexStr._aligned(hex_str, align)})"
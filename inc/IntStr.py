@@ -2,16 +2,26 @@ from inc.Exceptions import InvalidError
 
 
 class IntStr(str):
+    __slots__ = ("_value",)
+
+    _value: int
+
     def __new__(cls, value: str):
+        if type(value) is cls:
+            return value
+
         if not cls.is_IntStr(value):
             raise InvalidError("IntStr", value, "impossible to be integer")
 
-        return super().__new__(cls, value)
+        int_str = super().__new__(cls, value)
+        int_str._value = int(value)
+
+        return int_str
 
     @classmethod
     def is_IntStr(cls, value: str) -> bool:
-        return value.isdigit()
+        return value.isascii() and value.isdigit()
 
     @property
     def value(self) -> int:
-        return int(self)
+        return self._value
@@ -0,0 +1,133 @@
+from typing import Any, Iterator, List, Tuple
+from heapq import heappop, heappush
+
+
+class _Progression:
+    __slots__ = ("_item", "_start", "_width", "_step", "_count")
+
+    def __init__(self, item: Any, start: int, width: int, step: int, count: int):
+        self._item: Any = item
+        self._start: int = start
+        self._width: int = width
+        self._step: int = step
+        self._count: int = count
+
+    @property
+    def item(self) -> Any:
+        return self._item
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def end(self) -> int:
+        return self.get(self._count - 1) + self._width
+
+    def get(self, element: int) -> int:
+        return self._start + self._step * element
+
+    def elements(self, start: int, end: int) -> range:
+        if self._count == 1 or self._step == 0:
+            return range(1 if self._start < end and start < self.end else 0)
+
+        return range(
+            max(0, (start - self._start - self._width) // self._step + 1),
+            min(self._count, (end - self._start - 1) // self._step + 1),
+        )
+
+    def overlaps(self, other: "_Progression") -> Iterator[Tuple[int, int]]:
+        if other is self:
+            if self._width <= self._step:
+                return
+
+            yield from self._aligned(self)
+            return
+
+        if 0 < self._step == other._step and 1 < self._count and 1 < other.count:
+            yield from self._aligned(other)
+            return
+
+        for element in self.elements(other.start, other.end):
+            start = self.get(element)
+            for other_element in other.elements(start, start + self._width):
+                yield element, other_element
+
+    def _aligned(self, other: "_Progression") -> Iterator[Tuple[int, int]]:
+        distance = other.start - self._start
+
+        first = (-other._width - distance) // self._step + 1
+        last = (self._width - distance - 1) // self._step
+
+        if other is self:
+            first = max(first, 1)
+
+        pairs = [
+            (element, element + shift)
+            for shift in range(first, last + 1)
+            for element in range(max(0, -shift), min(self._count, other.count - shift))
+        ]
+        pairs.sort()
+
+        yield from pairs
+
+
+class IntervalIndex:
+    def __init__(self) -> None:
+        self._progressions: List[_Progression] = []
+
+    def __len__(self) -> int:
+        return len(self._progressions)
+
+    def append(self, start: int, end: int, item: Any) -> None:
+        self.append_progression(start, end, item, 0, 1)
+
+    def append_progression(
+        self,
+        start: int,
+        end: int,
+        item: Any,
+        step: int,
+        count: int,
+    ) -> None:
+        if 0 < count and start < end:
+            self._progressions.append(
+                _Progression(item, start, end - start, step, count)
+            )
+
+    def overlaps(self) -> List[Tuple[Tuple[Any, int, int], Tuple[Any, int, int]]]:
+        pairs = []
+
+        def collect(a: _Progression, b: _Progression) -> None:
+            if a.count > b.count:
+                pairs.extend(
+                    ((a.item, i, a.get(i)), (b.item, j, b.get(j)))
+                    for j, i in b.overlaps(a)
+                )
+
+            else:
+                pairs.extend(
+                    ((a.item, i, a.get(i)), (b.item, j, b.get(j)))
+                    for i, j in a.overlaps(b)
+                )
+
+        active: List[Tuple[int, int, _Progression]] = []
+        for sequence, progression in enumerate(
+            sorted(self._progressions, key=lambda p: (p.start, p.end))
+        ):
+            while active and active[0][0] <= progression.start:
+                heappop(active)
+
+            for _, _, other in active:
+                collect(other, progression)
+
+            if 1 < progression.count:
+                collect(progression, progression)
+
+            heappush(active, (progression.end, sequence, progression))
+
+        return pairs
@@ -0,0 +1,122 @@
+from typing import Any, Dict, Final, Optional
+from hashlib import sha256
+from os import getpid, listdir, makedirs, remove, replace, stat, utime
+from os.path import join
+from pickle import HIGHEST_PROTOCOL, dump, load
+
+from inc.ReadFile import ReadFile
+
+
+class ModelCache:
+    extension: str = ".pickle"
+    entries: Final[int] = 16
+
+    _models: Dict[str, Any] = {}
+
+    def __init__(self, dir: Optional[str], name: str, version: str, limit: int) -> None:
+        self._dir: Optional[str] = dir
+        self._name: str = name
+        self._version: str = version
+        self._limit: int = limit
+
+    @property
+    def dir(self) -> Optional[str]:
+        return self._dir
+
+    def load(self, file: ReadFile) -> Optional[Any]:
+        key = self._key(file)
+
+        if (model := ModelCache._models.pop(key, None)) is not None:
+            ModelCache._models[key] = model
+            return model
+
+        if self._dir is None:
+            return None
+
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as cached:
+                model = load(cached)
+
+            utime(path)
+
+        except FileNotFoundError:
+            return None
+
+        except Exception:
+            self._remove(path)
+            return None
+
+        self._keep(key, model)
+
+        return model
+
+    def store(self, file: ReadFile, model: Any) -> None:
+        key = self._key(file)
+
+        self._keep(key, model)
+
+        if self._dir is None:
+            return
+
+        path = self._path(key)
+        temp = f"{path}.{getpid()}.tmp"
+
+        try:
+            makedirs(self._dir, exist_ok=True)
+
+            with open(temp, "wb") as cached:
+                dump(model, cached, protocol=HIGHEST_PROTOCOL)
+
+            replace(temp, path)
+
+        except Exception:
+            self._remove(temp)
+            return
+
+        self._evict()
+
+    def _key(self, file: ReadFile) -> str:
+        return sha256(f"{self._name} {self._version} {file.hash}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return join(self._dir, key + ModelCache.extension)
+
+    def _keep(self, key: str, model: Any) -> None:
+        ModelCache._models.pop(key, None)
+        ModelCache._models[key] = model
+
+        while len(ModelCache._models) > ModelCache.entries:
+            del ModelCache._models[next(iter(ModelCache._models))]
+
+    def _evict(self) -> None:
+        entries = []
+
+        for name in listdir(self._dir):
+            if not name.endswith(ModelCache.extension):
+                continue
+
+            try:
+                entry = stat(path := join(self._dir, name))
+
+            except OSError:
+                continue
+
+            entries.append((entry.st_mtime, entry.st_size, path))
+
+        size = sum(entry[1] for entry in entries)
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self._limit:
+                break
+
+            self._remove(path)
+            size -= entry_size
+
+    def _remove(self, path: str) -> None:
+        try:
+            remove(path)
+
+        except OSError:
+            pass
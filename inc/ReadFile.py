@@ -1,4 +1,5 @@
-from typing import Tuple, List
+from typing import Any, Dict, Iterator, Tuple, List, Optional
+from io import BytesIO, TextIOWrapper
 from os.path import isfile
 from hashlib import sha256
 from csv import reader
@@ -12,6 +13,11 @@ class ReadFile:
             raise NotExistError("File", f"{path} is not exist")
 
         self._path: str = path
+        self._hash: Optional[str] = None
+        self._data: Optional[bytes] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"_path": self._path, "_hash": self._hash, "_data": None}
 
     @property
     def path(self) -> str:
@@ -19,37 +25,81 @@ class ReadFile:
 
     @property
     def hash(self) -> str:
-        engine = sha256()
-        with open(self._path, "rb") as file:
-            for block in iter(lambda: file.read(4096), b""):
-                engine.update(block)
+        if self._hash is None:
+            self._data = self._read()
 
-        return engine.hexdigest()
+        return self._hash
 
     @property
     def contents(self) -> str:
-        try:
-            with open(self._path, "r", encoding="UTF-8-sig") as file:
-                contents = file.read()
+        with self._open() as file:
+            try:
+                return file.read()
 
-        except Exception as e:
-            raise FailedError("Read", f"file({self._path}): {e}")
+            except Exception as e:
+                raise FailedError("Read", f"file({self._path}): {e}")
 
-        return contents
+    def csv_rows(
+        self,
+        keys: List[str],
+        optional_keys: List[str] = [],
+    ) -> Iterator[Tuple[int, List[str]]]:
+        with self._open() as file:
+            rows = reader(file)
 
-    @property
-    def csv_contents(self) -> Tuple[List[str], List]:
+            if (csv_keys := self._next(rows)) is None:
+                raise NotExistError("Rows", f"{self._path} file does not have rows")
+
+            for key in keys:
+                if key not in csv_keys:
+                    raise NotExistError(
+                        "Key",
+                        f"{key} is not exist for CSV" + f": keys({', '.join(keys)})",
+                    )
+
+            indexes = [csv_keys.index(key) for key in keys] + [
+                csv_keys.index(key) if key in csv_keys else None
+                for key in optional_keys
+            ]
+
+            while True:
+                line = rows.line_num + 1
+
+                if (row := self._next(rows)) is None:
+                    break
+
+                if not any(cell.strip() for cell in row):
+                    continue
+
+                yield line, [
+                    row[index] if index is not None and index < len(row) else ""
+                    for index in indexes
+                ]
+
+    def _open(self) -> TextIOWrapper:
+        data, self._data = self._data, None
+
+        return TextIOWrapper(
+            BytesIO(self._read() if data is None else data),
+            encoding="UTF-8-sig",
+            newline="",
+        )
+
+    def _read(self) -> bytes:
         try:
-            with open(self._path, "r", encoding="UTF-8-sig") as file:
-                rows = [row for row in reader(file)]
+            with open(self._path, "rb") as file:
+                data = file.read()
 
-        except Exception as e:
+        except OSError as e:
             raise FailedError("Read", f"file({self._path}): {e}")
 
-        if not len(rows):
-            raise NotExistError("Rows", f"{self._path} file does not have rows")
+        self._hash = sha256(data).hexdigest()
 
-        csv_keys = rows[0]
-        rows.pop(0)
+        return data
 
-        return csv_keys, [row for row in rows if any(cell.strip() for cell in row)]
+    def _next(self, rows) -> Optional[List[str]]:
+        try:
+            return next(rows, None)
+
+        except Exception as e:
+            raise FailedError("Read", f"file({self._path}): {e}")
@@ -0,0 +1,112 @@
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, Tuple
+from hashlib import sha256
+from os import getpid, remove, replace
+from os.path import exists
+from pickle import HIGHEST_PROTOCOL, dump, dumps, load
+
+from inc.Exceptions import FailedError
+from inc.Sink import Sink
+
+
+class SectionCache:
+    def __init__(self, path: Optional[str], salt: str = "") -> None:
+        self._path: Optional[str] = path
+        self._salt: bytes = salt.encode()
+
+        self._sections: Dict[bytes, Tuple[int, int, bytes]] = (
+            {} if path is None else self._load()
+        )
+        self._used: Dict[bytes, Tuple[int, int, bytes]] = {}
+        self._source: Optional[TextIO] = None
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    @property
+    def sidecar(self) -> Optional[str]:
+        return None if self._path is None else self._path + ".sections"
+
+    def key(self, *slices: Any) -> bytes:
+        return sha256(self._salt + dumps(slices, protocol=HIGHEST_PROTOCOL)).digest()
+
+    def render(self, sink: Sink, append: Callable[[], None], *slices: Any) -> None:
+        if self._path is None:
+            append()
+            return
+
+        key = self.key(*slices)
+        position = sink.tell()
+
+        if (span := self._sections.get(key)) is not None and self._valid(span):
+            for chunk in self._read(span):
+                sink.write(chunk)
+
+            self._used[key] = position, span[1], span[2]
+
+        else:
+            with sink.hashed() as hashed:
+                append()
+
+            self._used[key] = position, hashed[0], hashed[1]
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+        temp = f"{self.sidecar}.{getpid()}.tmp"
+
+        try:
+            with open(temp, "wb") as file:
+                dump(self._used, file, protocol=HIGHEST_PROTOCOL)
+
+            replace(temp, self.sidecar)
+
+        except OSError as e:
+            if exists(temp):
+                remove(temp)
+            raise FailedError("Write", f"file({self.sidecar}): {e}")
+
+        self._sections = self._used
+        self._used = {}
+
+    def _valid(self, span: Tuple[int, int, bytes]) -> bool:
+        digest = sha256()
+        length = 0
+
+        try:
+            for chunk in self._read(span):
+                digest.update(chunk.encode())
+                length += len(chunk)
+
+        except (OSError, ValueError, UnicodeDecodeError):
+            return False
+
+        return length == span[1] and digest.digest() == span[2]
+
+    def _read(self, span: Tuple[int, int, bytes]) -> Iterator[str]:
+        position, remaining, _ = span
+
+        if self._source is None:
+            self._source = open(self._path, "r")
+
+        self._source.seek(position)
+
+        while remaining and (chunk := self._source.read(min(remaining, 1 << 20))):
+            remaining -= len(chunk)
+
+            yield chunk
+
+    def _load(self) -> Dict[bytes, Tuple[int, int, bytes]]:
+        try:
+            with open(self.sidecar, "rb") as file:
+                sections = load(file)
+
+        except Exception:
+            return {}
+
+        return sections if isinstance(sections, dict) else {}
@@ -0,0 +1,47 @@
+from typing import Any, Iterator, List, Optional, TextIO
+from contextlib import contextmanager
+from hashlib import sha256
+
+
+class Sink:
+    def __init__(self, file: Optional[TextIO] = None) -> None:
+        self._file: Optional[TextIO] = file
+        self._chunks: List[str] = []
+        self._hash: Optional[Any] = None
+        self._length: int = 0
+
+    def __str__(self) -> str:
+        return "".join(self._chunks)
+
+    def write(self, contents: str) -> None:
+        if self._hash is not None:
+            self._hash.update(contents.encode())
+            self._length += len(contents)
+
+        if self._file is not None:
+            self._file.write(contents)
+
+        else:
+            self._chunks.append(contents)
+
+    def tell(self) -> int:
+        if self._file is not None:
+            return self._file.tell()
+
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def append_line(self, line: str) -> None:
+        self.write(line)
+        self.write("\n")
+
+    @contextmanager
+    def hashed(self) -> Iterator[List[Any]]:
+        span: List[Any] = []
+        self._hash, self._length = sha256(), 0
+
+        try:
+            yield span
+
+        finally:
+            span.extend((self._length, self._hash.digest()))
+            self._hash, self._length = None, 0
@@ -1,84 +1,116 @@
-from typing import List, Union
+from typing import Iterable, List, Optional, Union
+
+from inc.Table import Table
 
 
 class Str:
     def __init__(self, contents: str) -> None:
-        self._contents = contents
+        self._lines: Optional[List[str]] = contents.split("\n")
+        self._table: Optional[Table] = None
+        self._width: Optional[int] = None
 
     def __add__(self, other: Union["Str", str]) -> "Str":
-        return Str(
-            self._contents + (other.contents if isinstance(other, Str) else other)
-        )
+        lines = list(self.lines)
+        others = list(other.lines) if isinstance(other, Str) else other.split("\n")
+
+        contents = Str("")
+        contents._lines = lines[:-1] + [lines[-1] + others[0]] + others[1:]
+
+        return contents
 
     @classmethod
     def from_rows(cls, rows: List[List[str]], separator: str = " ") -> "Str":
         if not rows:
             return cls("")
 
-        nums = max(len(row) for row in rows)
-        for row in rows:
-            if len(row) < nums:
-                row.extend(["" for _ in range(0, nums - len(row))])
+        contents = cls("")
+        contents._lines = None
+        contents._table = Table(rows, separator)
 
-        columns = len(rows[0])
-        widths = [max(len(row[index]) for row in rows) for index in range(columns)]
-
-        aligned_rows = [
-            separator.join(
-                row[index].ljust(widths[index]) if index < columns - 1 else row[index]
-                for index in range(columns)
-            ).rstrip()
-            for row in rows
-        ]
-
-        return cls("\n".join(aligned_rows))
+        return contents
 
     def print(self) -> None:
-        print(self._contents)
+        print(self.contents)
 
     def append(self, other: "Str") -> "Str":
-        self._contents += "\n" + other._contents
+        self._extend(other.lines)
 
         return self
 
-    # TODO: when contents is empty string, max([]) or width - len(prefix) could be issue
-
     def insert_guard(self, guard: str, prefix: str = "") -> "Str":
-        width = max(len(line) for line in self._contents.split("\n"))
-        width -= len(prefix)
-
-        line = prefix + (guard * width)
-        self._contents = "\n".join([line, self._contents])
+        line = prefix + (guard * (self.width - len(prefix)))
+        self._insert(line)
 
         return self
 
     def add_guard(self, guard: str, prefix: str = "") -> "Str":
-        width = max(len(line) for line in self._contents.split("\n"))
-        width -= len(prefix)
-
-        line = prefix + (guard * width)
-        self._contents = "\n".join([line, self._contents, line])
+        line = prefix + (guard * (self.width - len(prefix)))
+        self._insert(line)
+        self._extend([line])
 
         return self
 
     def insert_line(self, line: str, prefix: str = "") -> "Str":
-        self._contents = "\n".join([prefix + line, self._contents])
+        for inserted in reversed((prefix + line).split("\n")):
+            self._insert(inserted)
 
         return self
 
     def append_line(self, line: str, prefix: str = "") -> "Str":
-        self._contents = "\n".join([self._contents, prefix + line])
+        self._extend((prefix + line).split("\n"))
 
         return self
 
     def add_prefix(self, prefix: str = "") -> "Str":
-        self._contents = "\n".join(prefix + line for line in self._contents.split("\n"))
+        self._lines = [prefix + line for line in self.lines]
+        self._table = None
+
+        if self._width is not None:
+            self._width += len(prefix)
 
         return self
 
     def __str__(self) -> str:
-        return self._contents
+        return self.contents
 
     @property
     def contents(self) -> str:
-        return self._contents
+        return "\n".join(self.lines)
+
+    @property
+    def lines(self) -> Iterable[str]:
+        if self._lines is None and self._table is not None:
+            return self._table.lines()
+
+        return self._materialize()
+
+    @property
+    def width(self) -> int:
+        if self._width is None:
+            self._width = max(len(line) for line in self._materialize())
+
+        return self._width
+
+    def _materialize(self) -> List[str]:
+        if self._lines is None:
+            self._lines = list(self._table.lines()) if self._table is not None else []
+            self._table = None
+
+        return self._lines
+
+    def _insert(self, line: str) -> None:
+        self._materialize().insert(0, line)
+
+        if self._width is not None:
+            self._width = max(self._width, len(line))
+
+    def _extend(self, lines: Iterable[str]) -> None:
+        contents = self._materialize()
+
+        if self._width is None:
+            contents.extend(lines)
+
+        else:
+            for line in lines:
+                contents.append(line)
+                self._width = max(self._width, len(line))
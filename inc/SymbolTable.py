@@ -0,0 +1,39 @@
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from inc.Exceptions import DuplicatedError
+
+
+class SymbolTable:
+    def __init__(self) -> None:
+        self._symbols: Dict[Tuple[Hashable, Optional[str]], Dict[str, Any]] = {}
+
+    def register(
+        self,
+        kind: Hashable,
+        name: str,
+        item: Any,
+        scope: Optional[str] = None,
+    ) -> None:
+        symbols = self._symbols.setdefault((kind, scope), {})
+
+        if name in symbols:
+            raise DuplicatedError("Name", name)
+
+        symbols[name] = item
+
+    def find(
+        self,
+        kind: Hashable,
+        name: str,
+        scope: Optional[str] = None,
+    ) -> Optional[Any]:
+        symbols = self._symbols.get((kind, scope))
+
+        return symbols.get(name) if symbols is not None else None
+
+    def exists(self, name: str, *kinds: Hashable, scope: Optional[str] = None) -> bool:
+        return any(
+            name in symbols
+            for kind in kinds
+            if (symbols := self._symbols.get((kind, scope))) is not None
+        )
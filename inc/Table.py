@@ -0,0 +1,82 @@
+from typing import Iterable, Iterator, List, Optional
+from tempfile import SpooledTemporaryFile
+
+
+class Table:
+    def __init__(self, rows: Iterable[List[str]] = (), separator: str = " ") -> None:
+        self._rows: List[List[str]] = []
+        self._widths: List[int] = []
+        self._count: int = 0
+        self._separator: str = separator
+        self._spool: Optional[SpooledTemporaryFile] = None
+
+        for row in rows:
+            self.append(row)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @classmethod
+    def spool(cls, rows: Iterable[List[str]] = (), separator: str = " ") -> "Table":
+        table = cls(separator=separator)
+        table._spool = SpooledTemporaryFile(
+            max_size=1 << 20, mode="w+", encoding="UTF-8", newline="\n"
+        )
+
+        for row in rows:
+            table.append(row)
+
+        return table
+
+    @property
+    def widths(self) -> List[int]:
+        return self._widths
+
+    def append(self, row: List[str]) -> "Table":
+        self._widen(row)
+
+        if self._spool is not None:
+            self._spool.write("\0".join(row) + "\n")
+
+        else:
+            self._rows.append(row)
+
+        return self
+
+    def lines(self) -> Iterator[str]:
+        if self._spool is not None:
+            return self._format(self._spooled())
+
+        return self._format(self._rows)
+
+    def _spooled(self) -> Iterator[List[str]]:
+        self._spool.seek(0)
+
+        for line in self._spool:
+            yield line[:-1].split("\0")
+
+    def _format(self, rows: Iterable[List[str]]) -> Iterator[str]:
+        separator = self._separator
+        widths = self._widths[:-1]
+        last = len(widths)
+
+        for row in rows:
+            cells = [
+                (row[index] if index < len(row) else "").ljust(width)
+                for index, width in enumerate(widths)
+            ]
+            cells.append(row[last] if last < len(row) else "")
+
+            yield separator.join(cells).rstrip()
+
+    def _widen(self, row: List[str]) -> None:
+        widths = self._widths
+
+        for index, cell in enumerate(row):
+            if index == len(widths):
+                widths.append(len(cell))
+
+            elif widths[index] < len(cell):
+                widths[index] = len(cell)
+
+        self._count += 1
@@ -0,0 +1,119 @@
+from typing import Any, List, Optional
+from argparse import Action, ArgumentParser, Namespace
+from copy import copy
+
+from inc.Exceptions import InvalidError, NotExistError
+
+
+class Target:
+    def __init__(self, gen: str, path: str, args: Namespace) -> None:
+        self._gen: str = gen
+        self._path: str = path
+        self._args: Namespace = args
+
+    @property
+    def gen(self) -> str:
+        return self._gen
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def args(self) -> Namespace:
+        return self._args
+
+    @classmethod
+    def from_args(
+        cls,
+        parser: ArgumentParser,
+        args: Namespace,
+        gen: Optional[str],
+        path: Optional[str],
+        gens: List[str],
+        keys: List[str],
+    ) -> List["Target"]:
+        targets = []
+
+        if gen is not None:
+            if path is None:
+                raise NotExistError("Target", f"{gen} should have output path")
+
+            targets.append(cls(gen, path, copy(args)))
+
+        for tokens in args.targets or []:
+            if len(tokens) < 2:
+                raise InvalidError(
+                    "Target",
+                    " ".join(tokens),
+                    "target should fit the format GEN PATH [KEY=VALUE ...]",
+                )
+
+            if tokens[0] not in gens:
+                raise InvalidError(
+                    "Target", tokens[0], f"gen should be one of {', '.join(gens)}"
+                )
+
+            target_args = copy(args)
+            for override in tokens[2:]:
+                key, separator, value = override.partition("=")
+                setattr(
+                    target_args, key, cls._value(parser, keys, key, value, separator)
+                )
+
+            targets.append(cls(tokens[0], tokens[1], target_args))
+
+        if not targets:
+            raise NotExistError("Target", "at least one gen and path should be given")
+
+        return targets
+
+    @staticmethod
+    def _value(
+        parser: ArgumentParser, keys: List[str], key: str, value: str, separator: str
+    ) -> Any:
+        actions = {
+            action.dest: action
+            for action in parser._actions
+            if action.option_strings and action.dest in keys
+        }
+
+        if not separator or (action := actions.get(key)) is None:
+            raise InvalidError(
+                "Target Option",
+                key,
+                f"option should fit KEY=VALUE: keys({', '.join(actions.keys())})",
+            )
+
+        if isinstance(action.const, bool):
+            if value.lower() not in ["true", "false"]:
+                raise InvalidError("Target Option", value, f"{key} should be bool")
+
+            return value.lower() == "true"
+
+        try:
+            converted = action.type(value) if callable(action.type) else value
+
+        except ValueError:
+            raise InvalidError("Target Option", value, f"{key} has invalid type")
+
+        if action.choices is not None and converted not in action.choices:
+            raise InvalidError(
+                "Target Option",
+                value,
+                f"{key} should be one of {', '.join(map(str, action.choices))}",
+            )
+
+        return converted
+
+    @staticmethod
+    def add_argument(parser: ArgumentParser) -> Action:
+        return parser.add_argument(
+            "-t",
+            "--target",
+            action="append",
+            nargs="+",
+            dest="targets",
+            metavar="GEN PATH [KEY=VALUE]",
+            help="additional gen target with config overrides",
+        )
@@ -0,0 +1,47 @@
+from typing import Optional, Tuple
+from os import stat
+from time import monotonic, sleep
+
+
+class Watcher:
+    def __init__(
+        self, path: str, interval: float = 0.05, debounce: float = 0.1
+    ) -> None:
+        self._path: str = path
+        self._interval: float = interval
+        self._debounce: float = debounce
+
+        self._signature: Optional[Tuple[int, int, int]] = self._stat()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def wait(self) -> None:
+        while True:
+            sleep(self._interval)
+
+            if (signature := self._stat()) is None or signature == self._signature:
+                continue
+
+            settled = monotonic()
+
+            while monotonic() - settled < self._debounce:
+                sleep(self._interval)
+
+                if (current := self._stat()) != signature:
+                    signature = current
+                    settled = monotonic()
+
+            if signature is not None:
+                self._signature = signature
+                return
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            result = stat(self._path)
+
+        except OSError:
+            return None
+
+        return result.st_mtime_ns, result.st_size, result.st_ino
@@ -1,24 +1,74 @@
-from os import mkdir
-from os.path import dirname, exists
+from typing import Iterator, List
+from contextlib import contextmanager
+from filecmp import cmp
+from os import getpid, mkdir, remove, replace
+from os.path import dirname, exists, isfile
 
 from inc.Exceptions import FailedError
+from inc.Sink import Sink
 
 
 class WriteFile:
     def __init__(self, path: str) -> None:
         self._path: str = path
+        self._changed: bool = False
 
     @property
     def path(self) -> str:
         return self._path
 
+    @property
+    def changed(self) -> bool:
+        return self._changed
+
+    def starts_with(self, lines: List[str]) -> bool:
+        if not isfile(self._path):
+            return False
+
+        try:
+            with open(self._path, "r") as file:
+                return all(file.readline().rstrip("\n") == line for line in lines)
+
+        except (OSError, UnicodeDecodeError):
+            return False
+
     def write(self, contents: str) -> None:
+        with self.open() as sink:
+            sink.write(contents)
+
+    @contextmanager
+    def open(self) -> Iterator[Sink]:
         if (dir := dirname(self._path)) and not exists(dir):
             mkdir(dir)
 
+        temp = f"{self._path}.{getpid()}.tmp"
+
         try:
-            with open(self._path, "w") as file:
-                file.write(contents)
+            file = open(temp, "w")
 
         except Exception as e:
             raise FailedError("Write", f"file({self._path}): {e}")
+
+        try:
+            with file:
+                yield Sink(file)
+
+            self._changed = not (
+                isfile(self._path) and cmp(temp, self._path, shallow=False)
+            )
+
+            if self._changed:
+                replace(temp, self._path)
+
+            else:
+                remove(temp)
+
+        except OSError as e:
+            if exists(temp):
+                remove(temp)
+            raise FailedError("Write", f"file({self._path}): {e}")
+
+        except BaseException:
+            if exists(temp):
+                remove(temp)
+            raise
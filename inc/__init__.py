@@ -4,9 +4,21 @@ from inc.Exceptions import (
     NotExistError,
     DuplicatedError,
     FailedError,
+    UserError,
 )
 from inc.ReadFile import ReadFile
 from inc.WriteFile import WriteFile
+from inc.Target import Target
+from inc.Table import Table
 from inc.Str import Str
+from inc.Sink import Sink
 from inc.HexStr import HexStr
 from inc.IntStr import IntStr
+from inc.SymbolTable import SymbolTable
+from inc.ArrayRange import ArrayRange
+from inc.ArrayBase import ArrayBase
+from inc.IntervalIndex import IntervalIndex
+from inc.ModelCache import ModelCache
+from inc.SectionCache import SectionCache
+from inc.Watcher import Watcher
+from inc.Depfile import Depfile
@@ -1,10 +1,19 @@
-from typing import Final, Dict, Type
+from sys import argv
+
+from genclient import forward, server
+
+if __name__ == "__main__" and (path := server(argv[1:])) is not None:
+    raise SystemExit(forward(path, "reggen", argv[1:]))
+
+from typing import Final, Dict, List, Optional, Type
 from enum import Enum
-from argparse import ArgumentParser
-from os.path import splitext, basename
+from argparse import ArgumentParser, Namespace
+from os import utime
+from os.path import abspath, basename, dirname, join, splitext
 
 from infos import reggen_name, reggen_version
-from inc import InvalidError, Str, ReadFile, WriteFile
+from inc import InvalidError, UserError, Str, ReadFile, WriteFile, Target
+from inc import ModelCache, SectionCache, Watcher, Depfile
 from src.Reg import RegConfig, RegDef
 from src.Reg import RegGen, RegCHeader, RegVerilogHeader, RegDoc, RegCTestHeader
 
@@ -24,13 +33,73 @@ RegGens: Final[Dict[Gen, Type[RegGen]]] = {
 }
 
 
-if __name__ == "__main__":
+def generate(
+    args: Namespace,
+    targets: List[Target],
+    configs: List[RegConfig],
+    cache: Optional[ModelCache],
+    sections: List[Optional[SectionCache]],
+) -> None:
+    deffile = ReadFile(args.RegDef)
+    regdef = None
+
+    for index, (target, config) in enumerate(zip(targets, configs)):
+        Str(str(config)).insert_guard(".").insert_line("Config").add_guard("-").print()
+
+        gen = Gen(target.gen)
+        file = WriteFile(target.path)
+
+        if (
+            not target.args.force
+            and not config.debug
+            and RegGens[gen].fresh(file, deffile, config)
+        ):
+            Str(f"{RegGens[gen].name} Up To Date").add_guard("=").print()
+            continue
+
+        if regdef is None:
+            regdef = RegDef.cached(deffile, config, cache)
+            if config.debug:
+                regdef.print()
+
+        Str.from_rows(
+            [["Reg Def", args.RegDef], ["Reg Gen", target.path]], separator=" : "
+        ).insert_guard(".").insert_line("File Paths").add_guard("-").print()
+
+        reggen = RegGens[gen](regdef, config)
+        reggen.generate(file, sections[index])
+
+        Str(f"{RegGens[gen].name} Generated").add_guard("=").print()
+
+    if args.stamp is not None:
+        WriteFile(args.stamp).write(
+            "\n".join(
+                [f"{reggen_name} {reggen_version}"]
+                + [
+                    f"{target.gen} {target.path} {config.fingerprint(RegGens[Gen(target.gen)].__name__)}"
+                    for target, config in zip(targets, configs)
+                ]
+            )
+            + "\n"
+        )
+
+        utime(args.stamp)
+
+    if args.depfile is not None:
+        Depfile(args.depfile).write(
+            [target.path for target in targets]
+            + ([] if args.stamp is None else [args.stamp]),
+            [args.RegDef, join(dirname(abspath(__file__)), "include", "const.h")],
+        )
+
+
+def main(argv: List[str], resident: bool = False) -> None:
     parser = ArgumentParser()
 
     # fmt: off
-    parser.add_argument("Gen",    type=str, help="Gen type",        choices=[gen.value for gen in Gen])
+    parser.add_argument("Gen",    type=str, help="Gen type",        choices=[gen.value for gen in Gen], nargs="?")
     parser.add_argument("RegDef", type=str, help="RegDef file path")
-    parser.add_argument("RegGen", type=str, help="RegGen file path")
+    parser.add_argument("RegGen", type=str, help="RegGen file path", nargs="?")
 
     parser.add_argument("-n", "--name", default="", type=str, help="IP name")
 
@@ -55,14 +124,41 @@ if __name__ == "__main__":
 
     parser.add_argument("--notes", default="", type=lambda s: s.replace('\\n', '\n'), help="notes for headers")
 
+    parser.add_argument("--cache",                  type=str, help="parsed definition cache directory")
+    parser.add_argument("--cache-size", default=64, type=int, help="parsed definition cache limit in MiB")
+    parser.add_argument("--sections",   default=False, help="reuse unchanged sections from a sidecar cache", action="store_true", dest="sections")
+    parser.add_argument("--watch",      default=False, help="regenerate whenever the definition changes",     action="store_true", dest="watch")
+    parser.add_argument("--depfile",                type=str, help="Makefile dependency file path")
+    parser.add_argument("--stamp",                  type=str, help="config fingerprint stamp file path")
+    parser.add_argument("--server",                 type=str, help="forward to a generation server socket")
+
     parser.add_argument("--no-annotation", default=True,  help="disable annotation",    action="store_false", dest="annotation")
     parser.add_argument("-d", "--debug",   default=False, help="enable debug messages", action="store_true",  dest="debug")
+    parser.add_argument("--force",         default=False, help="force generation",      action="store_true",  dest="force")
     # fmt: on
 
-    args = parser.parse_args()
+    Target.add_argument(parser)
+
+    args = parser.parse_args(argv)
 
-    if args.guard is None:
-        args.guard = splitext(basename(args.RegGen))[0].upper()
+    if args.server is not None and not resident:
+        raise SystemExit(forward(args.server, "reggen", argv))
+
+    if args.watch and resident:
+        raise InvalidError("Argument", "watch", "watch is not supported by the server")
+
+    targets = Target.from_args(
+        parser,
+        args,
+        args.Gen,
+        args.RegGen,
+        [gen.value for gen in Gen],
+        RegConfig.keys() + ["force", "sections"],
+    )
+
+    for target in targets:
+        if target.args.guard is None:
+            target.args.guard = splitext(basename(target.path))[0].upper()
 
     Str(f"{reggen_name} {reggen_version}").add_guard("=").print()
 
@@ -75,19 +171,43 @@ if __name__ == "__main__":
             f"path({args.RegDef}): regdef extension should be csv",
         )
 
-    config = RegConfig(args)
-    Str(str(config)).insert_guard(".").insert_line("Config").add_guard("-").print()
+    configs = [RegConfig(target.args) for target in targets]
+
+    cache = (
+        None
+        if args.cache is None and not resident
+        else ModelCache(args.cache, reggen_name, reggen_version, args.cache_size << 20)
+    )
+
+    sections = [
+        (
+            RegGens[Gen(target.gen)].section_cache(WriteFile(target.path), config)
+            if target.args.sections
+            else None
+        )
+        for target, config in zip(targets, configs)
+    ]
+
+    generate(args, targets, configs, cache, sections)
+
+    if args.watch:
+        watcher = Watcher(args.RegDef)
+
+        Str(f"Watching {args.RegDef}").add_guard("=").print()
 
-    regdef = RegDef(ReadFile(args.RegDef), config)
-    if config.debug:
-        regdef.print()
+        try:
+            while True:
+                watcher.wait()
 
-    Str.from_rows(
-        [["Reg Def", args.RegDef], ["Reg Gen", args.RegGen]], separator=" : "
-    ).insert_guard(".").insert_line("File Paths").add_guard("-").print()
+                try:
+                    generate(args, targets, configs, cache, sections)
 
-    gen = Gen(args.Gen)
-    reggen = RegGens[gen](regdef, config)
-    reggen.generate(WriteFile(args.RegGen))
+                except UserError as e:
+                    print(f"{type(e).__name__}: {e}")
 
-    Str(f"{RegGens[gen].name} Generated").add_guard("=").print()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main(argv[1:])
@@ -1,11 +1,12 @@
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from heapq import merge
 
-from infos import memgen_name, memgen_version
-from inc import WriteFile, Str, HexStr, NotExpectedError
+from inc import WriteFile, SectionCache, Str, Sink, Table, HexStr, ArrayRange
+from inc import NotExpectedError
 
 from src.Mem.MemGen import MemGen
 from src.Mem.MemConfig import MemConfig
-from src.Mem.MemDef import MemDef, Address, Array
+from src.Mem.MemDef import MemDef, Address, Array, Alias, Bookmark
 
 
 class MemCHeader(MemGen):
@@ -15,321 +16,297 @@ class MemCHeader(MemGen):
         self._memdef = memdef
         self._config = config
 
-        self._contents = ""
+        self._contents = Sink()
+        self._sections = SectionCache(None)
 
-    def generate(self, file: WriteFile) -> None:
-        self._set_address_rows()
-        self._set_array_rows()
-        self._set_alias_rows()
-        self._set_bookmark_rows()
-        self._set_address_row_header()
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
+        self._sections = sections if sections is not None else SectionCache(None)
 
-        if not self._config.annotation:
-            self._remove_address_annotation()
+        self._set_references()
 
-        self._append_note_header()
-        self._append_open_header_guard()
-        self._append_includes()
+        with file.open() as sink:
+            self._contents = sink
 
-        self._append_address_section()
-        self._append_array_section()
-        self._append_alias_section()
-        self._append_bookmark_section()
+            self._append_note_header()
+            self._append_open_header_guard()
+            self._append_includes()
 
-        self._append_close_header_guard()
+            self._append_address_section()
+            self._append_array_section()
+            self._append_alias_section()
+            self._append_bookmark_section()
 
-        self._write(file)
+            self._append_close_header_guard()
 
-    def _set_address_rows(self) -> None:
-        self._address_rows = []
+        self._sections.save()
 
-        for address in self._memdef.addresses:
-            self._address_rows.append(
-                [
-                    "#define",
-                    self._name(address.name),
-                    address.address,
-                    "//",
-                    "",  # Array
-                    "|",
-                    "",  # Alias
-                    "|",
-                    "",  # Bookmark
-                ]
-            )
+    def _addresses(self) -> Iterator[Tuple[str, Address]]:
+        return merge(
+            (("", address) for address in self._memdef.addresses),
+            *(self._array_addresses(array) for array in self._memdef.arrays),
+            key=lambda item: item[1].address.value,
+        )
 
-        for array in self._memdef.arrays:
-            for address in array.addresses:
-                self._address_rows.append(
-                    [
-                        "#define",
-                        self._name(address.name),
-                        address.address,
-                        "//",
-                        array.name,  # Array
-                        "|",
-                        "",  # Alias
-                        "|",
-                        "",  # Bookmark
-                    ]
+    def _array_addresses(self, array: Array) -> Iterator[Tuple[str, Address]]:
+        for address in array.addresses:
+            yield array.name, address
+
+    def _alias_targets(self, alias: Alias) -> Iterator[Address]:
+        if type(alias.alias) == Address:
+            yield alias.alias
+
+        elif type(alias.alias) == Array:
+            yield from alias.alias.addresses
+
+        else:
+            raise NotExpectedError(f"Invalid, Alias({alias.name})")
+
+    def _set_references(self) -> None:
+        self._aliases: Dict[str, List[str]] = {}
+        self._bookmarks: Dict[str, List[str]] = {}
+        self._positions: Dict[str, int] = {}
+
+        for alias in self._memdef.aliases:
+            for address in self._alias_targets(alias):
+                self._aliases.setdefault(self._name(address.name), []).append(
+                    alias.name
                 )
 
-        self._address_rows.sort(key=lambda row: row[2].value)
+        for bookmark in self._memdef.bookmarks:
+            self._bookmarks.setdefault(self._name(bookmark.bookmark), []).append(
+                self._name(bookmark.name)
+            )
+
+        for index, (_, address) in enumerate(self._addresses()):
+            name = self._name(address.name)
+
+            if name in self._aliases or name in self._bookmarks:
+                self._positions.setdefault(name, index)
+
+        for name, aliases in self._aliases.items():
+            if name not in self._positions:
+                raise NotExpectedError(f"Invalid, Alias({aliases[0]}): no address")
+
+        for name in self._bookmarks:
+            if name not in self._positions:
+                raise NotExpectedError(f"Not Exist, Bookmark({name})")
+
+    def _address_rows(self) -> Iterator[List[str]]:
+        columns = [
+            (
+                4,
+                any(
+                    range_.count
+                    for array in self._memdef.arrays
+                    for range_ in array.ranges
+                ),
+            ),
+            (6, bool(self._aliases)),
+            (8, bool(self._bookmarks)),
+        ]
+
+        if self._config.annotation and any(kept for _, kept in columns):
+            if self._memdef.addresses or columns[0][1]:
+                yield self._address_row(
+                    ["", "", "", "//", "Array", "|", "Alias", "|", "Bookmark"],
+                    columns,
+                )
 
-        for row in self._address_rows:
-            row[2] = self._address(row[2])
+        for array, address in self._addresses():
+            name = self._name(address.name)
 
-    def _set_address_row_header(self) -> None:
-        if self._address_rows:
-            self._address_rows.insert(
-                0,
+            yield self._address_row(
                 [
-                    "",
-                    "",
-                    "",
+                    "#define",
+                    name,
+                    self._address(address.address),
                     "//",
-                    "Array",
+                    array,  # Array
                     "|",
-                    "Alias",
+                    ", ".join(self._aliases.get(name, [])),  # Alias
                     "|",
-                    "Bookmark",
+                    ", ".join(self._bookmarks.get(name, [])),  # Bookmark
                 ],
+                columns,
             )
 
-            removed = 0
-            for index in range(4, 9, 2):
-                if all(not row[index - removed] for row in self._address_rows[1:]):
-                    for row in self._address_rows:
-                        del row[index - removed]  # Array, Alias, Bookmark
-                        if index != 8:
-                            del row[index - removed]  # |
-
-                    removed += 2
-
-            if removed == 6:
-                del self._address_rows[0]
+    def _address_row(
+        self, row: List[str], columns: List[Tuple[int, bool]]
+    ) -> List[str]:
+        if not self._config.annotation:
+            return row[:3]
 
-                for row in self._address_rows:
-                    del row[3]  # //
+        removed = 0
+        for index, kept in columns:
+            if not kept:
+                del row[index - removed]  # Array, Alias, Bookmark
+                if index != 8:
+                    del row[index - removed]  # |
 
-    def _remove_address_annotation(self) -> None:
-        del self._address_rows[0]
+                removed += 2
 
-        for row in self._address_rows:
-            for _ in range(3, len(row)):
-                del row[3]
+        if removed == 6:
+            del row[3]  # //
 
-    def _set_array_rows(self) -> None:
-        self._array_num_rows = []
-        self._array_rows = []
-        self._array_step_rows = []
+        return row
 
+    def _array_num_rows(self) -> Iterator[List[str]]:
         for array in self._memdef.arrays:
-            self._array_num_rows.append(
-                [
-                    "#define",
-                    self._name(
-                        array.name,
-                        tails=[self._config.array.upper(), self._config.number],
-                    ),
-                    f"( {array.indexes[-1] + 1} )",
-                ]
-            )
-
+            yield [
+                "#define",
+                self._name(
+                    array.name,
+                    tails=[self._config.array.upper(), self._config.number],
+                ),
+                f"( {array.number} )",
+            ]
+
+    def _array_rows(self) -> Iterator[List[str]]:
         for array in self._memdef.arrays:
-            self._array_rows.append(
-                [
-                    "#define",
-                    f"{self._name(array.name)}{self._config.plural}",
-                    "{ "
-                    + ", ".join(
-                        (
-                            self._name(array.addresses[array.indexes.index(index)].name)
-                            if index in array.indexes
-                            else "NULL"
-                        )
-                        for index in range(array.indexes[-1] + 1)
+            yield [
+                "#define",
+                f"{self._name(array.name)}{self._config.plural}",
+                "{ "
+                + ", ".join(
+                    (
+                        self._name(f"{array.name}_{index}")
+                        if value is not None
+                        else "NULL"
                     )
-                    + " }",
-                ]
-            )
+                    for index, value in enumerate(array.table)
+                )
+                + " }",
+            ]
 
+    def _array_step_rows(self) -> Iterator[List[str]]:
         for array in self._memdef.arrays:
             if (values := array.step) is not None:
                 base, step, shift = values
 
                 if shift is not None:
-                    self._array_step_rows.append(
-                        [
-                            "#define",
-                            f"{self._name(array.name)}({self._config.array})",
-                            f"( {self._address(base)} + ( {self._config.array} << {shift} ) )",
-                        ]
-                    )
-
-                elif step is not None:
-                    self._array_step_rows.append(
-                        [
-                            "#define",
-                            f"{self._name(array.name)}({self._config.array})",
-                            f"( {self._address(base)} + ( {self._config.array} * {step} ) )",
-                        ]
-                    )
-
-                else:
-                    self._array_step_rows.append(
-                        [
-                            "#define",
-                            f"{self._name(array.name)}({self._config.array})",
-                            f"( {self._address(base)} )",
-                            f"// ONLY {self._name(array.addresses[0].name)}",
-                        ]
-                    )
-
-            else:
-                self._array_step_rows.append(
-                    [
+                    yield [
                         "#define",
                         f"{self._name(array.name)}({self._config.array})",
-                        "",
-                        "// IMPOSSIBLE",
+                        f"( {self._address(base)} + ( {self._config.array} << {shift} ) )",
                     ]
-                )
-
-    def _set_alias_rows(self) -> None:
-        self._alias_address_rows = []
-        self._alias_array_num_rows = []
-        self._alias_array_rows = []
-        self._alias_array_step_rows = []
 
-        for alias in self._memdef.aliases:
-            if type(alias.alias) == Address:
-                self._alias_address_rows.append(
-                    [
+                elif step is not None:
+                    yield [
                         "#define",
-                        self._name(alias.name),
-                        f"( {self._name(alias.alias.name)} )",
-                        alias.alias.address,
+                        f"{self._name(array.name)}({self._config.array})",
+                        f"( {self._address(base)} + ( {self._config.array} * {step} ) )",
                     ]
-                )
-
-                for row in self._address_rows:
-                    if row[1] == self._name(alias.alias.name):
-                        row[6] += (", " if row[6] else "") + alias.name
-
-                        break
 
                 else:
-                    raise NotExpectedError(f"Invalid, Alias({alias.name}): no address")
-
-            elif type(alias.alias) == Array:
-                for address in alias.alias.addresses:
-                    index = Array.get_index(address.name)
-
-                    self._alias_address_rows.append(
-                        [
-                            "#define",
-                            self._name(f"{alias.name}_{index}"),
-                            f"( {self._name(address.name)} )",
-                            address.address,
-                        ]
-                    )
-
-                    for row in self._address_rows:
-                        if row[1] == self._name(address.name):
-                            row[6] += (", " if row[6] else "") + alias.name
-
-                            break
-
-                    else:
-                        raise NotExpectedError(
-                            f"Invalid, Alias({alias.name}): no address"
-                        )
-
-                self._alias_array_num_rows.append(
-                    [
-                        "#define",
-                        self._name(
-                            alias.name,
-                            tails=[self._config.array.upper(), self._config.number],
-                        ),
-                        f"( {self._name(alias.alias.name, tails=[self._config.array.upper(), self._config.number])} )",
-                    ]
-                )
-
-                self._alias_array_rows.append(
-                    [
+                    yield [
                         "#define",
-                        f"{self._name(alias.name)}{self._config.plural}",
-                        f"( {self._name(alias.alias.name)}{self._config.plural} )",
-                    ]
-                )
-
-                self._alias_array_step_rows.append(
-                    [
-                        "#define",
-                        f"{self._name(alias.name)}({self._config.array})",
-                        f"( {self._name(alias.alias.name)}({self._config.array}) )",
+                        f"{self._name(array.name)}({self._config.array})",
+                        f"( {self._address(base)} )",
+                        f"// ONLY {self._name(array.first.name)}",
                     ]
-                )
-
-            else:
-                raise NotExpectedError(f"Invalid, Alias({alias.name})")
-
-        self._alias_address_rows.sort(key=lambda row: row[3].value)
 
-        for row in self._alias_address_rows:
-            del row[3]
-
-    def _set_bookmark_rows(self) -> None:
-        self._bookmark_rows = []
-        self._bookmark_index_rows = []
-
-        for bookmark in self._memdef.bookmarks:
-            for row in self._address_rows:
-                if row[1] == self._name(bookmark.bookmark):
-                    row[8] += (", " if row[8] else "") + self._name(bookmark.name)
-
-                    break
-
-            else:
-                raise NotExpectedError(
-                    f"Not Exist, Bookmark({self._name(bookmark.bookmark)})"
-                )
+            elif len(array.segments) <= 1:
+                yield [
+                    "#define",
+                    f"{self._name(array.name)}({self._config.array})",
+                    "",
+                    "// IMPOSSIBLE",
+                ]
 
-            self._bookmark_rows.append(
-                [
+    def _array_segment_rows(self) -> Iterator[List[str]]:
+        for array in self._memdef.arrays:
+            if array.step is None and 1 < len(array.segments):
+                yield [
                     "#define",
-                    self._name(bookmark.name),
-                    self._name(bookmark.bookmark),
+                    f"{self._name(array.name)}({self._config.array})",
+                    "( "
+                    + ArrayRange.segmented(
+                        array.segments,
+                        self._config.array,
+                        lambda base: self._address(HexStr.from_int(base)),
+                    )
+                    + " )",
+                    ArrayRange.undefined(array.gaps),
                 ]
+
+    def _alias_address_rows(self) -> Iterator[List[str]]:
+        return (
+            row[:3]
+            for row in merge(
+                *(self._alias_addresses(alias) for alias in self._memdef.aliases),
+                key=lambda row: row[3].value,
+            )
+        )
+
+    def _alias_addresses(self, alias: Alias) -> Iterator[list]:
+        for address in self._alias_targets(alias):
+            name = (
+                alias.name
+                if type(alias.alias) == Address
+                else f"{alias.name}_{Array.get_index(address.name)}"
             )
 
+            yield [
+                "#define",
+                self._name(name),
+                f"( {self._name(address.name)} )",
+                address.address,
+            ]
+
+    def _alias_arrays(self) -> Iterator[Alias]:
+        return (alias for alias in self._memdef.aliases if type(alias.alias) == Array)
+
+    def _alias_array_num_rows(self) -> Iterator[List[str]]:
+        for alias in self._alias_arrays():
+            yield [
+                "#define",
+                self._name(
+                    alias.name,
+                    tails=[self._config.array.upper(), self._config.number],
+                ),
+                f"( {self._name(alias.alias.name, tails=[self._config.array.upper(), self._config.number])} )",
+            ]
+
+    def _alias_array_rows(self) -> Iterator[List[str]]:
+        for alias in self._alias_arrays():
+            yield [
+                "#define",
+                f"{self._name(alias.name)}{self._config.plural}",
+                f"( {self._name(alias.alias.name)}{self._config.plural} )",
+            ]
+
+    def _alias_array_step_rows(self) -> Iterator[List[str]]:
+        for alias in self._alias_arrays():
+            yield [
+                "#define",
+                f"{self._name(alias.name)}({self._config.array})",
+                f"( {self._name(alias.alias.name)}({self._config.array}) )",
+            ]
+
+    def _sorted_bookmarks(self) -> List[Bookmark]:
+        return sorted(
+            self._memdef.bookmarks,
+            key=lambda bookmark: self._positions[self._name(bookmark.bookmark)],
+        )
+
+    def _bookmark_rows(self) -> Iterator[List[str]]:
+        for bookmark in self._sorted_bookmarks():
+            yield [
+                "#define",
+                self._name(bookmark.name),
+                f"( {self._name(bookmark.bookmark)} )",
+            ]
+
+    def _bookmark_index_rows(self) -> Iterator[List[str]]:
+        for bookmark in self._sorted_bookmarks():
             if (index := bookmark.index) is not None:
-                self._bookmark_index_rows.append(
-                    [
-                        "#define",
-                        self._name(bookmark.name, tails=[self._config.array.upper()]),
-                        self._name(bookmark.bookmark),
-                        f"( {index} )",
-                    ]
-                )
-
-        def bookmark_index(bookmark_row):
-            for index, row in enumerate(self._address_rows):
-                if row[1] == bookmark_row[2]:
-                    return index
-
-            raise NotExpectedError(f"Not Exist, Bookmark({bookmark_row[2]})")
-
-        self._bookmark_rows.sort(key=bookmark_index)
-        self._bookmark_index_rows.sort(key=bookmark_index)
-
-        for bookmark_row in self._bookmark_rows:
-            bookmark_row[2] = f"( {bookmark_row[2]} )"
-
-        for bookmark_index_row in self._bookmark_index_rows:
-            del bookmark_index_row[2]
+                yield [
+                    "#define",
+                    self._name(bookmark.name, tails=[self._config.array.upper()]),
+                    f"( {index} )",
+                ]
 
     def _name(self, name: str, tails: List[str] = []) -> str:
         if not tails:
@@ -341,21 +318,20 @@ class MemCHeader(MemGen):
         return name
 
     def _address(self, address: HexStr) -> str:
-        prefix = "UL(" if self._config.bits == 32 else "ULL("
-        postfix = ")"
+        wrapper = "UL" if self._config.bits == 32 else "ULL"
 
-        return f"{prefix}{address.get_aligned(self._config.align)}{postfix}"
+        return address.get_wrapped(wrapper, self._config.align)
 
     def _append(self, c: str) -> None:
-        self._contents += c + "\n"
+        self._contents.append_line(c)
 
     def _append_str(self, s: Str) -> None:
-        self._append(str(s))
+        for line in s.lines:
+            self._append(line)
 
     def _append_note_header(self) -> None:
-        self._append(f"// Do not edit!")
-        self._append(f"// This is generated by {memgen_name} {memgen_version}")
-        self._append(f"// MemDef hash({self._memdef.file.hash})")
+        for line in self.fingerprint(self._memdef.file, self._config):
+            self._append(line)
 
         if self._config.notes:
             self._append("")
@@ -377,56 +353,103 @@ class MemCHeader(MemGen):
         self._append_str(Str(section).add_guard("=").add_prefix("// "))
 
     def _append_address_section(self) -> None:
-        if self._address_rows:
-            self._append("")
-            self._append_str(Str.from_rows(self._address_rows))
+        self._sections.render(
+            self._contents,
+            lambda: self._append_rows(self._address_rows()),
+            "address",
+            self._memdef.addresses,
+            self._array_slice(),
+            self._aliases,
+            self._bookmarks,
+        )
 
     def _append_array_section(self) -> None:
-        parts = [self._array_num_rows, self._array_rows, self._array_step_rows]
+        self._sections.render(
+            self._contents, self._append_array_parts, "array", self._array_slice()
+        )
 
-        if any(parts):
-            self._append_section_header("Array Section")
+    def _append_array_parts(self) -> None:
+        parts = [
+            self._array_num_rows(),
+            self._array_rows(),
+            self._array_step_rows(),
+            self._array_segment_rows(),
+        ]
 
-        for rows in parts:
-            if rows:
-                self._append("")
-                self._append_str(Str.from_rows(rows))
+        self._append_parts("Array Section", parts)
 
     def _append_alias_section(self) -> None:
+        self._sections.render(
+            self._contents, self._append_alias_parts, "alias", self._alias_slice()
+        )
+
+    def _append_alias_parts(self) -> None:
         parts = [
-            self._alias_address_rows,
-            self._alias_array_num_rows,
-            self._alias_array_rows,
-            self._alias_array_step_rows,
+            self._alias_address_rows(),
+            self._alias_array_num_rows(),
+            self._alias_array_rows(),
+            self._alias_array_step_rows(),
         ]
 
-        if any(parts):
-            self._append_section_header("Alias Section")
-
-        for rows in parts:
-            if rows:
-                self._append("")
-                self._append_str(Str.from_rows(rows))
+        self._append_parts("Alias Section", parts)
 
     def _append_bookmark_section(self) -> None:
+        self._sections.render(
+            self._contents,
+            self._append_bookmark_parts,
+            "bookmark",
+            [
+                (bookmark.name, bookmark.bookmark, bookmark.index)
+                for bookmark in self._sorted_bookmarks()
+            ],
+        )
+
+    def _append_bookmark_parts(self) -> None:
         parts = [
-            self._bookmark_rows,
-            self._bookmark_index_rows,
+            self._bookmark_rows(),
+            self._bookmark_index_rows(),
+        ]
+
+        self._append_parts("Bookmark Section", parts)
+
+    def _array_slice(self) -> List[Tuple[str, List[ArrayRange]]]:
+        return [(array.name, array.ranges) for array in self._memdef.arrays]
+
+    def _alias_slice(self) -> List[Tuple[str, Any]]:
+        return [
+            (
+                alias.name,
+                (
+                    alias.alias
+                    if type(alias.alias) == Address
+                    else (alias.alias.name, alias.alias.ranges)
+                ),
+            )
+            for alias in self._memdef.aliases
         ]
 
-        if any(parts):
-            self._append_section_header("Bookmark Section")
+    def _append_parts(self, section: str, parts: List[Iterator[List[str]]]) -> None:
+        tables = [Table.spool(rows) for rows in parts]
+
+        if any(tables):
+            self._append_section_header(section)
 
-        for rows in parts:
-            if rows:
+        for table in tables:
+            if table:
                 self._append("")
-                self._append_str(Str.from_rows(rows))
+
+                for line in table.lines():
+                    self._append(line)
+
+    def _append_rows(self, rows: Iterator[List[str]]) -> None:
+        if table := Table.spool(rows):
+            self._append("")
+
+            for line in table.lines():
+                self._append(line)
 
     def _append_close_header_guard(self) -> None:
         guard = self._config.guard + "_H"
 
         self._append("")
         self._append(f"#endif // {guard}")
-
-    def _write(self, file: WriteFile) -> None:
-        file.write(self._contents)
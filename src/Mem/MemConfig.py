@@ -1,5 +1,6 @@
-from typing import Final, Dict, Optional, Type, Tuple
+from typing import Final, Dict, List, Optional, Type, Tuple
 from argparse import Namespace
+from hashlib import sha256
 
 from inc import InvalidError, NotExistError
 from inc import Str
@@ -82,6 +83,10 @@ class MemConfig:
         self._invalid_args(args)
         self._set_args(args)
 
+    @classmethod
+    def keys(cls) -> List[str]:
+        return list(cls._rules.keys())
+
     def __str__(self) -> str:
         return Str.from_rows(
             [
@@ -94,6 +99,18 @@ class MemConfig:
             separator=" : ",
         ).contents
 
+    def fingerprint(self, gen: str) -> str:
+        return sha256(
+            repr(
+                [gen]
+                + [
+                    (name, getattr(self, name))
+                    for name in MemConfig._rules.keys()
+                    if name != "debug"
+                ]
+            ).encode()
+        ).hexdigest()
+
     @property
     def memory(self) -> str:
         return self._memory
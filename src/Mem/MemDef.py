@@ -1,9 +1,19 @@
-from typing import List, Union, Optional, Tuple
+from typing import Dict, Iterator, List, Union, Optional
 from enum import Enum
 from re import match
 
 from inc import InvalidError, DuplicatedError, NotExistError, NotExpectedError
-from inc import ReadFile, Str, HexStr, IntStr
+from inc import (
+    ReadFile,
+    ModelCache,
+    Str,
+    HexStr,
+    IntStr,
+    SymbolTable,
+    ArrayRange,
+    ArrayBase,
+    IntervalIndex,
+)
 
 from src.Mem.MemConfig import MemConfig
 
@@ -14,6 +24,11 @@ class _Key(Enum):
     DEFINE = "define"
 
 
+class _OptKey(Enum):
+    SIZE = "size"
+    END = "end"
+
+
 class _Kind(Enum):
     ADDRESS = "address,="
     ARRAY = "array,*"
@@ -21,6 +36,13 @@ class _Kind(Enum):
     BOOKMARK = "bookmark,#"
 
 
+class _Symbol(Enum):
+    ADDRESS = "address"
+    ARRAY = "array"
+    ALIAS = "alias"
+    BOOKMARK = "bookmark"
+
+
 class MemDef:
     name: str = "Memory Definition"
 
@@ -32,39 +54,61 @@ class MemDef:
         self._aliases: List[Alias] = []
         self._bookmarks: List[Bookmark] = []
 
-        keys, rows = file.csv_contents
+        self._symbols = SymbolTable()
 
-        for key in _Key:
-            if key.value not in keys:
-                raise NotExistError(
-                    "Key",
-                    f"{key.value} is not exist for CSV"
-                    + f": keys({', '.join(key.value for key in _Key)})",
-                )
+        deferred: Dict[_Kind, List[_Row]] = {_Kind.ALIAS: [], _Kind.BOOKMARK: []}
 
-        for row in rows:
-            if not all(row[keys.index(key.value)] for key in _Key):
+        for line, row in file.csv_rows(
+            [key.value for key in _Key], [key.value for key in _OptKey]
+        ):
+            if not all(row[: len(_Key)]):
                 raise InvalidError(
                     "CSV Row",
                     ",".join(row),
-                    "all cell of defined keys should be exist"
+                    f"line({line}): all cell of defined keys should be exist"
                     + f": keys({', '.join(key.value for key in _Key)})",
                 )
 
-        rows = [_Row(*[row[keys.index(key.value)] for key in _Key]) for row in rows]
+            row = _Row(line, *row)
 
-        for kind, add in {
-            _Kind.ADDRESS: self._address,
-            _Kind.ARRAY: self._array,
-            _Kind.ALIAS: self._alias,
-            _Kind.BOOKMARK: self._bookmark,
-        }.items():
-            for row in rows:
-                if row.kind == kind:
-                    add(row)
+            if row.kind == _Kind.ADDRESS:
+                self._address(row)
+
+            elif row.kind == _Kind.ARRAY:
+                self._array(row)
+
+            else:
+                deferred[row.kind].append(row)
+
+        for row in deferred[_Kind.ALIAS]:
+            self._alias(row)
+
+        for row in deferred[_Kind.BOOKMARK]:
+            self._bookmark(row)
+
+        for array in self._arrays:
+            array.finalize()
 
-        self._addresses = sorted(self._addresses)
-        self._arrays = sorted(self._arrays)
+        self._addresses.sort()
+        self._arrays.sort()
+
+        self._check_overlaps()
+
+    @classmethod
+    def cached(
+        cls, file: ReadFile, config: MemConfig, cache: Optional[ModelCache]
+    ) -> "MemDef":
+        if cache is None:
+            return cls(file, config)
+
+        if (memdef := cache.load(file)) is None:
+            memdef = cls(file, config)
+            cache.store(file, memdef)
+
+        else:
+            memdef._file = file
+
+        return memdef
 
     def print(self) -> None:
         print(
@@ -141,13 +185,18 @@ class MemDef:
         return self._bookmarks
 
     def _address(self, row: "_Row") -> None:
-        if row.name in [address.name for address in self._addresses]:
+        if self._symbols.exists(
+            row.name, _Symbol.ADDRESS, _Symbol.ARRAY
+        ) or self._element(row.name):
             raise DuplicatedError("Name", row.name)
 
-        self._addresses.append(Address(row.name, row.value))
+        address = Address(row.name, row.value, self._size(row))
+
+        self._addresses.append(address)
+        self._symbols.register(_Symbol.ADDRESS, address.name, address)
 
     def _array(self, row: "_Row") -> None:
-        if row.name in [address.name for address in self._addresses]:
+        if self._symbols.exists(row.name, _Symbol.ADDRESS):
             raise DuplicatedError("Name", row.name)
 
         tokens = row.define.split(",")
@@ -170,88 +219,83 @@ class MemDef:
                 + f": step is zero, but count({count}) is greater than 1",
             )
 
-        address = HexStr(row.value)
-        array_addresses = [
-            Address(
-                f"{row.name}_{index}",
-                f"0x{(int(address, 16) + (int(step, 16) * (index - int(start)))):X}",
-            )
-            for index in range(int(start), int(start) + int(count))
-        ]
-
-        for address in array_addresses:
-            if address.name in (
-                [address.name for address in self._addresses]
-                + [
-                    address.name
-                    for array in self._arrays
-                    for address in array.addresses
-                ]
-            ):
-                raise DuplicatedError("Name", address.name)
+        range_ = ArrayRange(
+            HexStr(row.value).value, start.value, count.value, step.value
+        )
 
-        for array in self._arrays:
-            if array.name == row.name:
-                array.extend(array_addresses)
-                break
+        for index in range_.indexes:
+            if self._symbols.exists(name := f"{row.name}_{index}", _Symbol.ADDRESS):
+                raise DuplicatedError("Name", name)
+
+        if (array := self._symbols.find(_Symbol.ARRAY, row.name)) is not None:
+            for other in array.ranges:
+                if range_.overlaps(other):
+                    raise DuplicatedError(
+                        "Name", f"{row.name}_{max(range_.start, other.start)}"
+                    )
+
+            if array.size != (size := self._size(row)):
+                raise InvalidError(
+                    "Size",
+                    str(size),
+                    f"array({row.name}) should have same size for all elements"
+                    + f": size({array.size})",
+                )
+
+            array.extend([range_] if range_.count else [])
 
         else:
-            self._arrays.append(Array(row.name, array_addresses))
+            array = Array(row.name, [range_] if range_.count else [], self._size(row))
+
+            self._arrays.append(array)
+            self._symbols.register(_Symbol.ARRAY, array.name, array)
 
     def _alias(self, row: "_Row") -> None:
-        if row.name in (
-            [address.name for address in self._addresses]
-            + [array.name for array in self._arrays]
-            + [address.name for array in self._arrays for address in array.addresses]
-            + [alias.name for alias in self._aliases]
-        ):
+        if self._symbols.exists(
+            row.name,
+            _Symbol.ADDRESS,
+            _Symbol.ARRAY,
+            _Symbol.ALIAS,
+        ) or self._element(row.name):
             raise DuplicatedError("Name", row.name)
 
-        for address in self._addresses:
-            if row.value == address.name:
-                self._aliases.append(Alias(row.name, address))
-                return
+        alias = (
+            self._symbols.find(_Symbol.ADDRESS, row.value)
+            or self._symbols.find(_Symbol.ARRAY, row.value)
+            or self._element(row.value)
+        )
 
-        for array in self._arrays:
-            if row.value == array.name:
-                self._aliases.append(Alias(row.name, array))
-                return
+        if alias is None:
+            raise NotExistError(
+                "Alias", f"{row.value} is not exist to register {row.name}"
+            )
 
-            for address in array.addresses:
-                if row.value == address.name:
-                    self._aliases.append(Alias(row.name, address))
-                    return
+        alias = Alias(row.name, alias)
 
-        raise NotExistError("Alias", f"{row.value} is not exist to register {row.name}")
+        self._aliases.append(alias)
+        self._symbols.register(_Symbol.ALIAS, alias.name, alias)
 
     def _bookmark(self, row: "_Row") -> None:
-        if row.name in (
-            [address.name for address in self._addresses]
-            + [array.name for array in self._arrays]
-            + [address.name for array in self._arrays for address in array.addresses]
-            + [alias.name for alias in self._aliases]
-            + [bookmark.name for bookmark in self._bookmarks]
-        ):
+        if self._symbols.exists(
+            row.name,
+            _Symbol.ADDRESS,
+            _Symbol.ARRAY,
+            _Symbol.ALIAS,
+            _Symbol.BOOKMARK,
+        ) or self._element(row.name):
             raise DuplicatedError("Name", row.name)
 
+        bookmark = None
+
         tokens = row.define.split(",")
         if len(tokens) == 1:
-            for address in self._addresses:
-
-                if row.value == address.name:
-                    self._bookmarks.append(Bookmark(row.name, row.value))
-                    return
+            if self._symbols.exists(row.value, _Symbol.ADDRESS):
+                bookmark = Bookmark(row.name, row.value)
 
         elif len(tokens) == 2:
             index = tokens[1]
-            for array in self._arrays:
-                if row.value == array.name:
-                    for address in array.addresses:
-                        if (target := f"{row.value}_{index}") == address.name:
-                            self._bookmarks.append(
-                                Bookmark(row.name, target, int(index))
-                            )
-                            return
+            if self._element(target := f"{row.value}_{index}") is not None:
+                bookmark = Bookmark(row.name, target, int(index))
 
         else:
             raise InvalidError(
@@ -260,14 +304,101 @@ class MemDef:
                 f"invalid number of tokens in define: expected 1(address) or 2(array)",
             )
 
-        raise NotExistError(
-            "Bookmark",
-            f"{row.value} is not exist to register {row.name}",
+        if bookmark is None:
+            raise NotExistError(
+                "Bookmark",
+                f"{row.value} is not exist to register {row.name}",
+            )
+
+        self._bookmarks.append(bookmark)
+        self._symbols.register(_Symbol.BOOKMARK, bookmark.name, bookmark)
+
+    def _size(self, row: "_Row") -> Optional[int]:
+        size = row.size.value if row.size is not None else None
+
+        if row.end is not None:
+            end = row.end.value - HexStr(row.value).value + 1
+
+            if end <= 0:
+                raise InvalidError(
+                    "End", row.end, f"end should not be less than value({row.value})"
+                )
+
+            if size is not None and size != end:
+                raise InvalidError(
+                    "End",
+                    row.end,
+                    f"end does not match size({row.size}) from value({row.value})",
+                )
+
+            size = end
+
+        if size is not None and size <= 0:
+            raise InvalidError("Size", str(row.size), "size should be greater than 0")
+
+        return size
+
+    def _check_overlaps(self) -> None:
+        index = IntervalIndex()
+
+        for address in self._addresses:
+            if address.size is not None:
+                start = address.address.value
+                index.append(start, start + address.size, (address.name, None))
+
+        for array in self._arrays:
+            if array.size is not None:
+                for range_ in array.ranges:
+                    index.append_progression(
+                        range_.base,
+                        range_.base + array.size,
+                        (array.name, range_.start),
+                        range_.step,
+                        range_.count,
+                    )
+
+        name = lambda item, element: (
+            item[0] if item[1] is None else f"{item[0]}_{item[1] + element}"
         )
 
+        if pairs := index.overlaps():
+            raise DuplicatedError(
+                "Region",
+                ", ".join(f"{name(*a[:2])}, {name(*b[:2])}" for a, b in pairs[:1]),
+                f"{len(pairs)} overlapped pair(s)"
+                + "".join(
+                    f"\n      {name(*a[:2])}({HexStr.from_int(a[2])})"
+                    + f" & {name(*b[:2])}({HexStr.from_int(b[2])})"
+                    for a, b in pairs
+                ),
+            )
+
+    def _element(self, name: str) -> Optional["Address"]:
+        tokens = name.rsplit("_", 1)
+        if (
+            len(tokens) != 2
+            or not tokens[1].isdigit()
+            or tokens[1] != str(int(tokens[1]))
+        ):
+            return None
+
+        array = self._symbols.find(_Symbol.ARRAY, tokens[0])
+
+        return array.get(int(tokens[1])) if array is not None else None
+
 
 class _Row:
-    def __init__(self, name: str, value: str, define: str) -> None:
+    __slots__ = ("_line", "_name", "_value", "_define", "_size", "_end", "_kind")
+
+    def __init__(
+        self,
+        line: int,
+        name: str,
+        value: str,
+        define: str,
+        size: str = "",
+        end: str = "",
+    ) -> None:
         if name in ["int", "float", "while", "if", "else", "return"] or (
             not bool(match(r"^[A-Za-z_][A-Za-z0-9_]*$", name))
         ):
@@ -286,17 +417,33 @@ class _Row:
             raise InvalidError(
                 "Kind",
                 defined_kind,
-                f"name({name}), value({value}), define({define})"
+                f"line({line}), name({name}), value({value}), define({define})"
                 + f": kind should be one of these types"
                 + f": {', '.join({token for kind in _Kind for token in kind.value.strip().split(',')})}",
             )
 
+        if (size or end) and kind != _Kind.ADDRESS and kind != _Kind.ARRAY:
+            raise InvalidError(
+                "CSV Row",
+                ",".join([name, value, define, size, end]),
+                "size and end are only for address or array",
+            )
+
+        self._line = line
         self._name = name
         self._value = value
         self._define = define
+        self._size = (
+            (IntStr(size) if IntStr.is_IntStr(size) else HexStr(size)) if size else None
+        )
+        self._end = HexStr(end) if end else None
 
         self._kind = kind
 
+    @property
+    def line(self) -> int:
+        return self._line
+
     @property
     def name(self) -> str:
         return self._name
@@ -309,6 +456,14 @@ class _Row:
     def define(self) -> str:
         return self._define
 
+    @property
+    def size(self) -> Optional[Union[IntStr, HexStr]]:
+        return self._size
+
+    @property
+    def end(self) -> Optional[HexStr]:
+        return self._end
+
     @property
     def kind(self) -> _Kind:
         if self._kind is None:
@@ -318,9 +473,12 @@ class _Row:
 
 
 class Address:
-    def __init__(self, name: str, address: str) -> None:
+    __slots__ = ("_name", "_address", "_size")
+
+    def __init__(self, name: str, address: str, size: Optional[int] = None) -> None:
         self._name: str = name
         self._address: HexStr = HexStr(address)
+        self._size: Optional[int] = size
 
     def __lt__(self, other: "Address") -> bool:
         return self._address.value < other.address.value
@@ -333,63 +491,38 @@ class Address:
     def address(self) -> HexStr:
         return self._address
 
-
-class Array:
-    def __init__(self, name: str, addresses: List[Address]) -> None:
-        self._name = name
-        self._addresses = sorted(addresses)
-
-    def __lt__(self, other: "Array") -> bool:
-        return self.addresses[0].address.value < other.addresses[0].address.value
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def addresses(self) -> List[Address]:
-        return self._addresses
-
-    @property
-    def indexes(self) -> List[int]:
-        return [self.get_index(address.name) for address in self._addresses]
-
     @property
-    def step(self) -> Optional[Tuple[HexStr, Optional[HexStr], Optional[int]]]:
-        if len(self.addresses) == 0:
-            return None
+    def size(self) -> Optional[int]:
+        return self._size
 
-        if len(self.addresses) == 1:
-            return self.addresses[0].address, None, None
 
-        start_index = self.get_index(self.addresses[0].name)
-        start_address = self.addresses[0].address.value
+class Array(ArrayBase):
+    __slots__ = ("_size",)
 
-        step = (self.addresses[1].address.value - start_address) / (
-            self.get_index(self.addresses[1].name) - start_index
-        )
+    def __init__(
+        self,
+        name: str,
+        ranges: List[ArrayRange],
+        size: Optional[int] = None,
+    ) -> None:
+        super().__init__(name, ranges)
 
-        if not step.is_integer() or step <= 0:
-            return None
+        self._size = size
 
-        step = int(step)
-        base = start_address - (step * start_index)
+    def __lt__(self, other: "Array") -> bool:
+        return self.first.address.value < other.first.address.value
 
-        if any(
-            base != (address.address.value - (step * self.get_index(address.name)))
-            for address in self.addresses
-        ):
-            return None
+    def _element(self, index: int, value: int) -> Address:
+        return Address(f"{self._name}_{index}", HexStr.from_int(value))
 
-        return (
-            (HexStr.from_int(base), HexStr.from_int(step), step.bit_length() - 1)
-            if (step & (step - 1)) == 0
-            else (HexStr.from_int(base), HexStr.from_int(step), None)
-        )
+    @property
+    def size(self) -> Optional[int]:
+        return self._size
 
-    def extend(self, addresses: List[Address]):
-        self.addresses.extend(addresses)
-        self.addresses.sort()
+    @property
+    def addresses(self) -> Iterator[Address]:
+        for index, value in self.elements:
+            yield self._element(index, value)
 
     @staticmethod
     def get_index(name: str) -> int:
@@ -403,6 +536,8 @@ class Array:
 
 
 class Alias:
+    __slots__ = ("_name", "_alias")
+
     def __init__(self, name: str, alias: Union[Address, Array]) -> None:
         self._name = name
         self._alias = alias
@@ -417,6 +552,8 @@ class Alias:
 
 
 class Bookmark:
+    __slots__ = ("_name", "_bookmark", "_index")
+
     def __init__(self, name: str, bookmark: str, index: Optional[int] = None) -> None:
         self._name = name
         self._bookmark = bookmark
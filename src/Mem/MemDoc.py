@@ -1,4 +1,7 @@
+from typing import Optional
+
 from inc.WriteFile import WriteFile
+from inc.SectionCache import SectionCache
 
 from src.Mem.MemGen import MemGen
 from src.Mem.MemConfig import MemConfig
@@ -11,5 +14,7 @@ class MemDoc(MemGen):
     def __init__(self, memdef: MemDef, config: MemConfig) -> None:
         raise NotImplementedError()
 
-    def generate(self, file: WriteFile) -> None:
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
         raise NotImplementedError()
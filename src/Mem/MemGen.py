@@ -1,6 +1,8 @@
+from typing import List, Optional
 from abc import ABC, abstractmethod
 
-from inc import WriteFile
+from infos import memgen_name, memgen_version
+from inc import ReadFile, WriteFile, SectionCache
 
 from src.Mem.MemConfig import MemConfig
 from src.Mem.MemDef import MemDef
@@ -14,5 +16,27 @@ class MemGen(ABC):
         pass
 
     @abstractmethod
-    def generate(self, file: WriteFile) -> None:
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
         pass
+
+    @classmethod
+    def fingerprint(cls, file: ReadFile, config: MemConfig) -> List[str]:
+        return [
+            "// Do not edit!",
+            f"// This is generated by {memgen_name} {memgen_version}",
+            f"// MemDef hash({file.hash})",
+            f"// Config hash({config.fingerprint(cls.__name__)})",
+        ]
+
+    @classmethod
+    def fresh(cls, file: WriteFile, source: ReadFile, config: MemConfig) -> bool:
+        return file.starts_with(cls.fingerprint(source, config))
+
+    @classmethod
+    def section_cache(cls, file: WriteFile, config: MemConfig) -> SectionCache:
+        return SectionCache(
+            file.path,
+            f"{memgen_version} {config.fingerprint(cls.__name__)}",
+        )
@@ -1,7 +1,6 @@
-from typing import Optional, Union
+from typing import Iterator, List, Optional, Union
 
-from infos import pktgen_name, pktgen_version
-from inc import WriteFile, Str, HexStr, IntStr
+from inc import WriteFile, SectionCache, Str, Sink, Table, HexStr, IntStr
 
 from src.Pkt.PktGen import PktGen
 from src.Pkt.PktConfig import PktConfig
@@ -17,37 +16,42 @@ class PktCHeader(PktGen):
 
         self._items = self._pktdef.items
 
-        self._contents = ""
+        self._contents = Sink()
+        self._sections = SectionCache(None)
 
-    def generate(self, file: WriteFile) -> None:
-        self._set_annotation_rows()
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
+        self._sections = sections if sections is not None else SectionCache(None)
 
-        self._append_note_header()
-        self._append_open_header_guard()
-        self._append_includes()
+        with file.open() as sink:
+            self._contents = sink
 
-        if self._config.annotation:
-            self._append_annotation()
+            self._append_note_header()
+            self._append_open_header_guard()
+            self._append_includes()
 
-        self._append_packets()
+            if self._config.annotation:
+                self._sections.render(
+                    self._contents, self._append_annotation, "annotation", self._items
+                )
 
-        self._append_close_header_guard()
+            self._append_packets()
 
-        self._write(file)
+            self._append_close_header_guard()
 
-    def _set_annotation_rows(self) -> None:
-        self._annotation_rows = []
+        self._sections.save()
 
     def _append(self, c: str) -> None:
-        self._contents += c + "\n"
+        self._contents.append_line(c)
 
     def _append_str(self, s: Str) -> None:
-        self._append(str(s))
+        for line in s.lines:
+            self._append(line)
 
     def _append_note_header(self) -> None:
-        self._append(f"// Do not edit!")
-        self._append(f"// This is generated by {pktgen_name} {pktgen_version}")
-        self._append(f"// PktDef hash({self._pktdef.file.hash})")
+        for line in self.fingerprint(self._pktdef.file, self._config):
+            self._append(line)
 
         if self._config.notes:
             self._append("")
@@ -64,49 +68,37 @@ class PktCHeader(PktGen):
         self._append("")
         self._append("#include <const.h>")
 
-    def _append_annotation(self) -> None:
-        if self._items:
-            self._append("")
+    def _annotation_rows(self) -> Iterator[List[str]]:
+        yield ["//", "Group", "|", "Packet", "|", "Fields"]
 
-            rows = []
-            rows.append(
-                [
+        for item in self._items:
+            if isinstance(item, Packet):
+                yield [
                     "//",
-                    "Group",
+                    "",
                     "|",
-                    "Packet",
+                    f"{item.name}",
                     "|",
-                    "Fields",
+                    ", ".join(field.name for field in item.fields),
                 ]
-            )
 
-            for item in self._items:
-                if isinstance(item, Packet):
-                    rows.append(
-                        [
-                            "//",
-                            "",
-                            "|",
-                            f"{item.name}",
-                            "|",
-                            ", ".join(field.name for field in item.fields),
-                        ]
-                    )
+            elif isinstance(item, Group):
+                for packet in item.packets:
+                    yield [
+                        "//",
+                        item.name,
+                        "|",
+                        self._join(item.name, packet.name),
+                        "|",
+                        ", ".join(field.name for field in packet.fields),
+                    ]
 
-                elif isinstance(item, Group):
-                    for packet in item.packets:
-                        rows.append(
-                            [
-                                "//",
-                                item.name,
-                                "|",
-                                self._join(item.name, packet.name),
-                                "|",
-                                ", ".join(field.name for field in packet.fields),
-                            ]
-                        )
+    def _append_annotation(self) -> None:
+        if self._items:
+            self._append("")
 
-            self._append_str(Str.from_rows(rows))
+            for line in Table.spool(self._annotation_rows()).lines():
+                self._append(line)
 
     def _append_group_header(self, group: str) -> None:
         self._append("")
@@ -164,7 +156,7 @@ class PktCHeader(PktGen):
                                 [
                                     "#define",
                                     self._name(field_name, enum.name),
-                                    f"( {enum.value.value} )",
+                                    f"( {enum.value} )",
                                 ]
                                 for enum in field.enums
                             ]
@@ -178,7 +170,7 @@ class PktCHeader(PktGen):
                                 [
                                     "#define",
                                     self._name(field_name, enum.name, self._config.raw),
-                                    self._value(enum.value.value << field.bits[1]),
+                                    self._value(enum.value << field.bits[1]),
                                 ]
                                 for enum in field.enums
                             ]
@@ -253,7 +245,13 @@ class PktCHeader(PktGen):
     def _append_packets(self) -> None:
         for item in self._items:
             if isinstance(item, Packet):
-                self._append_packet(item)
+                self._sections.render(
+                    self._contents,
+                    lambda: self._append_packet(item),
+                    "packet",
+                    None,
+                    item,
+                )
 
             elif isinstance(item, Group):
                 self._append_group_header(
@@ -266,7 +264,13 @@ class PktCHeader(PktGen):
                 )
 
                 for packet in item.packets:
-                    self._append_packet(packet, group=item.name)
+                    self._sections.render(
+                        self._contents,
+                        lambda: self._append_packet(packet, group=item.name),
+                        "packet",
+                        item.name,
+                        packet,
+                    )
 
     def _append_close_header_guard(self) -> None:
         guard = self._config.guard + "_H"
@@ -274,9 +278,6 @@ class PktCHeader(PktGen):
         self._append("")
         self._append(f"#endif // {guard}")
 
-    def _write(self, file: WriteFile) -> None:
-        file.write(self._contents)
-
     def _join(self, *tokens) -> str:
         return "_".join(tokens)
 
@@ -290,4 +291,4 @@ class PktCHeader(PktGen):
         elif isinstance(value, int):
             value = HexStr.from_int(value)
 
-        return f"UL({value.get_aligned(8)})"
+        return value.get_wrapped("UL", 8)
@@ -1,6 +1,7 @@
 from typing import List, Union, Optional, Tuple
 from enum import Enum
 from re import match
+from sys import intern
 
 from inc import (
     InvalidError,
@@ -8,7 +9,7 @@ from inc import (
     NotExistError,
     NotExpectedError,
 )
-from inc import ReadFile, Str, HexStr, IntStr
+from inc import ReadFile, ModelCache, Str, HexStr, IntStr, SymbolTable
 
 from src.Pkt.PktConfig import PktConfig
 
@@ -43,6 +44,11 @@ class _Kind(Enum):
     ATTRIBUTE = "attribute,^"
 
 
+class _Symbol(Enum):
+    PACKET = "packet"
+    GROUP = "group"
+
+
 class PktDef:
     name: str = "Packet Definition"
 
@@ -53,22 +59,14 @@ class PktDef:
         self._groups: List[Group] = []
         self._items: List[Union[Packet, Group]] = []
 
-        keys, rows = file.csv_contents
-
-        for key in _Key:
-            if key.value not in keys:
-                raise NotExistError(
-                    "Key",
-                    f"{key.value} is not exist for CSV"
-                    + f": keys({', '.join(key.value for key in _Key)})",
-                )
-
-        rows = [_Row(*[row[keys.index(key.value)] for key in _Key]) for row in rows]
+        self._symbols = SymbolTable()
 
         packet = None
         field = None
 
-        for row in rows:
+        for line, row in file.csv_rows([key.value for key in _Key]):
+            row = _Row(line, *row)
+
             item = {
                 _Kind.PACKET: self._packet,
                 _Kind.GROUP: self._group,
@@ -82,6 +80,25 @@ class PktDef:
             elif isinstance(item, _Field):
                 field = item
 
+        for item in self._items:
+            item.finalize()
+
+    @classmethod
+    def cached(
+        cls, file: ReadFile, config: PktConfig, cache: Optional[ModelCache]
+    ) -> "PktDef":
+        if cache is None:
+            return cls(file, config)
+
+        if (pktdef := cache.load(file)) is None:
+            pktdef = cls(file, config)
+            cache.store(file, pktdef)
+
+        else:
+            pktdef._file = file
+
+        return pktdef
+
     def print(self) -> None:
         rows = []
         rows.append(
@@ -161,13 +178,14 @@ class PktDef:
         packet: Optional["Packet"],
         field: Optional["_Field"],
     ) -> "Packet":
-        if row.name in [packet.name for packet in self._packets]:
+        if self._symbols.exists(row.name, _Symbol.PACKET):
             raise DuplicatedError("Name", row.name)
 
         packet_ = Packet(row.name)
 
         self._packets.append(packet_)
         self._items.append(packet_)
+        self._symbols.register(_Symbol.PACKET, packet_.name, packet_)
 
         return packet_
 
@@ -185,25 +203,22 @@ class PktDef:
                 f"invalid number of tokens in define: expected 2",
             )
 
-        if (name := row.name + "_" + tokens[1]) in [
-            packet.name for packet in self._packets
-        ]:
+        if self._symbols.exists(name := row.name + "_" + tokens[1], _Symbol.PACKET):
             raise DuplicatedError("Name", name)
 
         packet = Packet(tokens[1])
 
         self._packets.append(packet)
+        self._symbols.register(_Symbol.PACKET, name, packet)
 
-        for group in self._groups:
-            if group.name == row.name:
-                group.append(packet)
-                break
-
-        else:
+        if (group := self._symbols.find(_Symbol.GROUP, row.name)) is None:
             group = Group(row.name)
-            group.append(packet)
+
             self._groups.append(group)
             self._items.append(group)
+            self._symbols.register(_Symbol.GROUP, group.name, group)
+
+        group.append(packet)
 
         return packet
 
@@ -272,15 +287,11 @@ class PktDef:
         if any(bit < 0 or bit > 31 for bit in bits):
             raise InvalidError("Bits", row.bits, "token of bits should be in 0 to 31")
 
-        if any(
-            field.bits[0] >= bits[0] >= field.bits[1]
-            or field.bits[0] >= bits[1] >= field.bits[1]
-            for field in packet.fields
-        ):
-            raise DuplicatedError("Bits", row.bits)
-
         field_ = _Field(row.field, bits)
 
+        if packet.mask & field_.mask:
+            raise DuplicatedError("Bits", row.bits)
+
         packet.append(field_)
 
         return field_
@@ -312,10 +323,10 @@ class PktDef:
 
         enum = _Enum(row.enum, row.value)
 
-        if any(e.value.value == enum.value.value for e in field.enums):
+        if any(e.value == enum.value for e in field.enums):
             raise DuplicatedError(
                 "Value",
-                enum.value,
+                row.value,
                 f"field({field.name}) has duplicated values",
             )
 
@@ -323,8 +334,20 @@ class PktDef:
 
 
 class _Row:
+    __slots__ = (
+        "_line",
+        "_name",
+        "_define",
+        "_field",
+        "_bits",
+        "_enum",
+        "_value",
+        "_kind",
+    )
+
     def __init__(
         self,
+        line: int,
         name: str,
         define: str,
         field: str,
@@ -352,11 +375,12 @@ class _Row:
             raise InvalidError(
                 "Kind",
                 defined_kind,
-                f"name({name}), define({define})"
+                f"line({line}), name({name}), define({define})"
                 + f": kind should be one of these types"
                 + f": {', '.join({token for kind in _Kind for token in kind.value.strip().split(',')})}",
             )
 
+        self._line = line
         self._name = name if name else None
         self._define = define
         self._field = field if field else None
@@ -370,7 +394,7 @@ class _Row:
                     raise InvalidError(
                         "CSV Row",
                         ",".join([name, define, field, bits, enum, value]),
-                        "all cell of defined keys for packet or group should be exist"
+                        f"line({line}): all cell of defined keys for packet or group should be exist"
                         + f": keys({', '.join(key.value for key in _PacketKey)})",
                     )
 
@@ -383,7 +407,7 @@ class _Row:
                         raise InvalidError(
                             "CSV Row",
                             ",".join([name, define, field, bits, enum, value]),
-                            "all cell of defined keys for field should be exist"
+                            f"line({line}): all cell of defined keys for field should be exist"
                             + f": keys({', '.join(key.value for key in _FieldKey)})",
                         )
 
@@ -395,12 +419,16 @@ class _Row:
                         raise InvalidError(
                             "CSV Row",
                             ",".join([name, define, field, bits, enum, value]),
-                            "all cell of defined keys for enum should be exist"
+                            f"line({line}): all cell of defined keys for enum should be exist"
                             + f": keys({', '.join(key.value for key in _EnumKey)})",
                         )
 
         self._kind = kind
 
+    @property
+    def line(self) -> int:
+        return self._line
+
     @property
     def name(self) -> str:
         if self._name is None:
@@ -443,10 +471,14 @@ class _Row:
 
 
 class Packet:
+    __slots__ = ("_name", "_fields", "_mask", "_finalized")
+
     def __init__(self, name: str) -> None:
         self._name: str = name
 
         self._fields: List[_Field] = []
+        self._mask: int = 0
+        self._finalized: bool = False
 
     @property
     def name(self) -> str:
@@ -456,16 +488,33 @@ class Packet:
     def fields(self) -> List["_Field"]:
         return self._fields
 
+    @property
+    def mask(self) -> int:
+        return self._mask
+
     def append(self, field: "_Field") -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Packet({self._name}): already finalized")
+
         self._fields.append(field)
+        self._mask |= field.mask
+
+    def finalize(self) -> None:
+        for field in self._fields:
+            field.finalize()
+
         self._fields.sort()
+        self._finalized = True
 
 
 class Group:
+    __slots__ = ("_name", "_packets", "_finalized")
+
     def __init__(self, name: str) -> None:
         self._name: str = name
 
         self._packets: List[Packet] = []
+        self._finalized: bool = False
 
     @property
     def name(self) -> str:
@@ -476,15 +525,28 @@ class Group:
         return self._packets
 
     def append(self, packet: Packet) -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Group({self._name}): already finalized")
+
         self._packets.append(packet)
 
+    def finalize(self) -> None:
+        for packet in self._packets:
+            packet.finalize()
+
+        self._finalized = True
+
 
 class _Field:
+    __slots__ = ("_name", "_bits", "_mask", "_enums", "_finalized")
+
     def __init__(self, name: str, bits: Tuple[int, int]) -> None:
-        self._name: str = name
+        self._name: str = intern(name)
         self._bits: Tuple[int, int] = bits
+        self._mask: int = ((1 << (bits[0] - bits[1] + 1)) - 1) << bits[1]
 
         self._enums: List[_Enum] = []
+        self._finalized: bool = False
 
     def __lt__(self, other: "_Field") -> bool:
         return self.bits[1] < other.bits[1]
@@ -497,29 +559,41 @@ class _Field:
     def bits(self) -> Tuple[int, int]:
         return self._bits
 
+    @property
+    def mask(self) -> int:
+        return self._mask
+
     @property
     def enums(self) -> List["_Enum"]:
         return self._enums
 
     def append(self, enum: "_Enum") -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Field({self._name}): already finalized")
+
         self._enums.append(enum)
+
+    def finalize(self) -> None:
         self._enums.sort()
+        self._finalized = True
 
 
 class _Enum:
+    __slots__ = ("_name", "_value")
+
     def __init__(self, name: str, value: str) -> None:
-        self._name: str = name
-        self._value: Union[IntStr, HexStr] = (
+        self._name: str = intern(name)
+        self._value: int = (
             IntStr(value) if IntStr.is_IntStr(value) else HexStr(value)
-        )
+        ).value
 
     def __lt__(self, other: "_Enum") -> bool:
-        return self.value.value < other.value.value
+        return self._value < other.value
 
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def value(self) -> Union[IntStr, HexStr]:
+    def value(self) -> int:
         return self._value
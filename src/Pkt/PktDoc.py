@@ -1,4 +1,7 @@
+from typing import Optional
+
 from inc.WriteFile import WriteFile
+from inc.SectionCache import SectionCache
 
 from src.Pkt.PktGen import PktGen
 from src.Pkt.PktConfig import PktConfig
@@ -11,5 +14,7 @@ class PktDoc(PktGen):
     def __init__(self, pktdef: PktDef, config: PktConfig) -> None:
         raise NotImplementedError()
 
-    def generate(self, file: WriteFile) -> None:
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
         raise NotImplementedError()
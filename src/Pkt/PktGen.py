@@ -1,6 +1,8 @@
+from typing import List, Optional
 from abc import ABC, abstractmethod
 
-from inc import WriteFile
+from infos import pktgen_name, pktgen_version
+from inc import ReadFile, WriteFile, SectionCache
 
 from src.Pkt.PktConfig import PktConfig
 from src.Pkt.PktDef import PktDef
@@ -14,5 +16,27 @@ class PktGen(ABC):
         pass
 
     @abstractmethod
-    def generate(self, file: WriteFile) -> None:
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
         pass
+
+    @classmethod
+    def fingerprint(cls, file: ReadFile, config: PktConfig) -> List[str]:
+        return [
+            "// Do not edit!",
+            f"// This is generated by {pktgen_name} {pktgen_version}",
+            f"// PktDef hash({file.hash})",
+            f"// Config hash({config.fingerprint(cls.__name__)})",
+        ]
+
+    @classmethod
+    def fresh(cls, file: WriteFile, source: ReadFile, config: PktConfig) -> bool:
+        return file.starts_with(cls.fingerprint(source, config))
+
+    @classmethod
+    def section_cache(cls, file: WriteFile, config: PktConfig) -> SectionCache:
+        return SectionCache(
+            file.path,
+            f"{pktgen_version} {config.fingerprint(cls.__name__)}",
+        )
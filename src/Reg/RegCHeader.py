@@ -1,11 +1,10 @@
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
-from infos import reggen_name, reggen_version
-from inc import WriteFile, Str, HexStr, IntStr
+from inc import WriteFile, SectionCache, Str, Sink, Table, HexStr, IntStr, ArrayRange
 
 from src.Reg.RegGen import RegGen
 from src.Reg.RegConfig import RegConfig
-from src.Reg.RegDef import RegDef, Offset, Opt
+from src.Reg.RegDef import RegDef, Offset, Array, Opt
 
 
 class RegCHeader(RegGen):
@@ -15,267 +14,225 @@ class RegCHeader(RegGen):
         self._regdef = regdef
         self._config = config
 
-        self._contents = ""
+        self._contents = Sink()
+        self._sections = SectionCache(None)
 
-    def generate(self, file: WriteFile) -> None:
-        self._set_register_rows()
-        self._set_array_rows()
-        self._set_offset_group_items()
-        self._set_offset_row_header()
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
+        self._sections = sections if sections is not None else SectionCache(None)
 
-        if not self._config.annotation:
-            self._remove_offset_annotation()
-
-        self._append_note_header()
-        self._append_open_header_guard()
-        self._append_includes()
+        with file.open() as sink:
+            self._contents = sink
 
-        self._append_register_section()
-        self._append_array_section()
-        self._append_field_section()
+            self._append_note_header()
+            self._append_open_header_guard()
+            self._append_includes()
 
-        self._append_close_header_guard()
+            self._append_register_section()
+            self._append_array_section()
+            self._append_field_section()
 
-        self._write(file)
+            self._append_close_header_guard()
 
-    def _set_register_rows(self) -> None:
-        self._offset_rows = []
-        self._register_rows = []
+        self._sections.save()
 
-        offsets = []
+    def _offset_rows(self) -> Iterator[List[str]]:
+        sources = [
+            (array, group)
+            for array, group in self._regdef.groups
+            if array is None or any(range_.count for range_ in array.ranges)
+        ]
 
-        for offset in self._regdef.offsets:
-            offsets.append([offset, offset, None])
-
-        for array in self._regdef._arrays:
-            for offset in array.offsets:
-                for group in array.groups:
-                    offsets.append(
-                        [
-                            Offset(
-                                self._join(array.name, offset.name, group.name),
-                                HexStr.from_int(
-                                    offset.offset.value + group.offset.value
-                                ),
-                            ),
-                            group,
-                            array,
-                        ]
-                    )
+        if not sources:
+            return
 
-        offsets.sort(key=lambda offset: offset[0])
+        columns = [
+            (6, any(array is not None for array, _ in sources)),
+            (8, any(group.fields for _, group in sources)),
+        ]
 
-        for offset, offset_field, array in offsets:
-            self._offset_rows.append(
-                [
-                    "#define",
-                    self._name(offset.name, tails=[self._config.offset]),
-                    f"( {self._address(offset.offset)} )",
-                    "//",
-                    (
-                        offset.name
-                        if array is None
-                        else self._join(array.name, offset_field.name)
-                    ),  # Keyword
-                    "|",
-                    "" if array is None else array.name,  # Array
-                    "|",
-                    ", ".join(field.name for field in offset_field.fields),  # Fields
-                ]
+        if self._config.annotation:
+            yield self._offset_row(
+                ["", "", "", "//", "ID", "|", "Array", "|", "Field"], columns
             )
 
-            self._register_rows.append(
+        for register in self._regdef.registers:
+            yield self._offset_row(
                 [
                     "#define",
-                    self._name(
-                        offset.name,
-                        tails=[self._config.register],
-                        argument=self._config.memory,
-                    ),
-                    f"( {self._config.memory} + {self._name(offset.name, tails=[self._config.offset])} )",
-                    "//",
-                    (
-                        offset.name
-                        if array is None
-                        else self._join(array.name, offset_field.name)
-                    ),  # Keyword
-                ]
-            )
-
-    def _set_offset_row_header(self) -> None:
-        if self._offset_rows:
-            self._offset_rows.insert(
-                0,
-                [
-                    "",
-                    "",
-                    "",
+                    self._name(register.name, tails=[self._config.offset]),
+                    f"( {self._address(register.offset)} )",
                     "//",
-                    "ID",
+                    register.keyword,  # Keyword
                     "|",
-                    "Array",
+                    "" if register.array is None else register.array.name,  # Array
                     "|",
-                    "Field",
+                    ", ".join(field.name for field in register.fields),  # Fields
                 ],
+                columns,
             )
 
-            removed = 0
-            for index in range(6, 9, 2):
-                if all(not row[index - removed] for row in self._offset_rows[1:]):
-                    for row in self._offset_rows:
-                        del row[index - removed]  # Field, Array
-                        if index != 8:
-                            del row[index - removed]  # |
-
-                    removed += 2
-
-    def _remove_offset_annotation(self) -> None:
-        if self._offset_rows:
-            del self._offset_rows[0]
-
-        for row in self._offset_rows:
-            for _ in range(3, len(row)):
-                del row[3]
-
-    def _set_array_rows(self) -> None:
-        self._array_num_rows = []
-        self._array_register_rows = []
-        self._array_step_rows = []
-
+    def _offset_row(self, row: List[str], columns: List[Tuple[int, bool]]) -> List[str]:
+        if not self._config.annotation:
+            return row[:3]
+
+        removed = 0
+        for index, kept in columns:
+            if not kept:
+                del row[index - removed]  # Field, Array
+                if index != 8:
+                    del row[index - removed]  # |
+
+                removed += 2
+
+        return row
+
+    def _register_rows(self) -> Iterator[List[str]]:
+        for register in self._regdef.registers:
+            yield [
+                "#define",
+                self._name(
+                    register.name,
+                    tails=[self._config.register],
+                    argument=self._config.memory,
+                ),
+                f"( {self._config.memory} + {self._name(register.name, tails=[self._config.offset])} )",
+                "//",
+                register.keyword,  # Keyword
+            ]
+
+    def _array_num_rows(self) -> Iterator[List[str]]:
         for array in self._regdef.arrays:
-            self._array_num_rows.append(
-                [
+            yield [
+                "#define",
+                self._name(
+                    array.name,
+                    tails=[self._config.array.upper(), self._config.number],
+                ),
+                f"( {array.number} )",
+            ]
+
+    def _array_register_rows(self) -> Iterator[List[str]]:
+        for array in self._regdef.arrays:
+            for group in array.groups:
+                yield [
                     "#define",
-                    self._name(
-                        array.name,
-                        tails=[self._config.array.upper(), self._config.number],
+                    f"{self._name(self._join(array.name, group.name), tails=[self._config.register])}{self._config.plural}({self._config.memory})",
+                    "{",
+                    ", ".join(
+                        (
+                            self._name(
+                                self._join(array.name, str(index), group.name),
+                                tails=[self._config.register],
+                                argument=self._config.memory,
+                            )
+                            if value is not None
+                            else "NULL"
+                        )
+                        for index, value in enumerate(array.table)
                     ),
-                    f"( {array.indexes[-1] + 1} )",
+                    "}",
                 ]
-            )
 
+    def _array_step_rows(self) -> Iterator[List[str]]:
         for array in self._regdef.arrays:
-            for group in array.groups:
-                self._array_register_rows.append(
-                    [
-                        "#define",
-                        f"{self._name(self._join(array.name, group.name), tails=[self._config.register])}{self._config.plural}({self._config.memory})",
-                        "{",
-                        ", ".join(
-                            (
-                                self._name(
-                                    self._join(array.name, str(index), group.name),
-                                    tails=[self._config.register],
-                                    argument=self._config.memory,
-                                )
-                                if index in array.indexes
-                                else "NULL"
-                            )
-                            for index in range(array.indexes[-1] + 1)
-                        ),
-                        "}",
-                    ]
-                )
+            if array.step is None and 1 < len(array.segments):
+                continue
 
-        for array in self._regdef.arrays:
             for group in array.groups:
                 if (values := array.step) is not None:
                     base, step, shift = values
 
                     if shift is not None:
-                        self._array_step_rows.append(
-                            [
-                                "#define",
-                                self._name(
-                                    self._join(array.name, group.name),
-                                    tails=[self._config.register],
-                                    argument=self._config.array,
-                                ),
-                                "(",
-                                f"{self._address(HexStr.from_int(base.value + group.offset.value))} + ( {self._config.array} << {shift}",
-                                ") )",
-                            ]
-                        )
+                        yield [
+                            "#define",
+                            self._name(
+                                self._join(array.name, group.name),
+                                tails=[self._config.register],
+                                argument=self._config.array,
+                            ),
+                            "(",
+                            f"{self._address(HexStr.from_int(base.value + group.offset.value))} + ( {self._config.array} << {shift}",
+                            ") )",
+                        ]
 
                     elif step is not None:
-                        self._array_step_rows.append(
-                            [
-                                "#define",
-                                self._name(
-                                    self._join(array.name, group.name),
-                                    tails=[self._config.register],
-                                    argument=self._config.array,
-                                ),
-                                "(",
-                                f"{self._address(HexStr.from_int(base.value + group.offset.value))} + ( {self._config.array} * {step}",
-                                ") )",
-                            ]
-                        )
+                        yield [
+                            "#define",
+                            self._name(
+                                self._join(array.name, group.name),
+                                tails=[self._config.register],
+                                argument=self._config.array,
+                            ),
+                            "(",
+                            f"{self._address(HexStr.from_int(base.value + group.offset.value))} + ( {self._config.array} * {step}",
+                            ") )",
+                        ]
 
                     else:
-                        self._array_step_rows.append(
-                            [
-                                "#define",
-                                self._name(
-                                    self._join(array.name, group.name),
-                                    tails=[self._config.register],
-                                    argument=self._config.array,
-                                ),
-                                "(",
-                                f"{self._address(HexStr.from_int(array.offsets[0].offset.value + group.offset.value))}",
-                                ")",
-                                f"// ONLY {array.name}",
-                            ]
-                        )
-
-                else:
-                    self._array_step_rows.append(
-                        [
+                        yield [
                             "#define",
                             self._name(
                                 self._join(array.name, group.name),
                                 tails=[self._config.register],
                                 argument=self._config.array,
                             ),
-                            "",
-                            "",
-                            "",
-                            f"// IMPOSSIBLE",
+                            "(",
+                            f"{self._address(HexStr.from_int(array.first.offset.value + group.offset.value))}",
+                            ")",
+                            f"// ONLY {array.name}",
                         ]
-                    )
 
-    def _set_offset_group_items(self) -> None:
-        self._items = []
+                else:
+                    yield [
+                        "#define",
+                        self._name(
+                            self._join(array.name, group.name),
+                            tails=[self._config.register],
+                            argument=self._config.array,
+                        ),
+                        "",
+                        "",
+                        "",
+                        f"// IMPOSSIBLE",
+                    ]
 
-        for offset in self._regdef.offsets:
-            self._items.append([None, offset, offset.offset.value])
+    def _array_segment_rows(self) -> Iterator[List[str]]:
+        for array in self._regdef.arrays:
+            if array.step is not None or len(array.segments) <= 1:
+                continue
 
-        for array in self._regdef._arrays:
             for group in array.groups:
-                self._items.append(
-                    [
-                        array,
-                        group,
-                        (
-                            array.offsets[0].offset.value
-                            if array.offsets
-                            else 0xFFFFFFFFFFFFFFFF
+                yield [
+                    "#define",
+                    self._name(
+                        self._join(array.name, group.name),
+                        tails=[self._config.register],
+                        argument=self._config.array,
+                    ),
+                    "( "
+                    + ArrayRange.segmented(
+                        array.segments,
+                        self._config.array,
+                        lambda base: self._address(
+                            HexStr.from_int(base + group.offset.value)
                         ),
-                    ]
-                )
-
-        self._items.sort(key=lambda offset: offset[2])
+                    )
+                    + " )",
+                    ArrayRange.undefined(array.gaps),
+                ]
 
     def _append(self, c: str) -> None:
-        self._contents += c + "\n"
+        self._contents.append_line(c)
 
     def _append_str(self, s: Str) -> None:
-        self._append(str(s))
+        for line in s.lines:
+            self._append(line)
 
     def _append_note_header(self) -> None:
-        self._append(f"// Do not edit!")
-        self._append(f"// This is generated by {reggen_name} {reggen_version}")
-        self._append(f"// RegDef hash({self._regdef.file.hash})")
+        for line in self.fingerprint(self._regdef.file, self._config):
+            self._append(line)
 
         if self._config.notes:
             self._append("")
@@ -301,264 +258,275 @@ class RegCHeader(RegGen):
         self._append("")
         self._append_str(Str(section).add_guard("=").add_prefix("// "))
 
-    def _append_register_section(self) -> None:
-        if self._offset_rows:
-            self._append("")
-            self._append_str(Str.from_rows(self._offset_rows))
-
-        if self._register_rows:
+    def _append_rows(self, rows: Iterator[List[str]]) -> None:
+        if table := Table.spool(rows):
             self._append("")
-            self._append_str(Str.from_rows(self._register_rows))
 
-    def _append_array_section(self) -> None:
-        parts = [self._array_num_rows, self._array_register_rows, self._array_step_rows]
+            for line in table.lines():
+                self._append(line)
 
-        if any(parts):
-            self._append_section_header("Array Section")
-
-        for rows in parts:
-            if rows:
-                self._append("")
-                self._append_str(Str.from_rows(rows))
+    def _append_register_section(self) -> None:
+        self._sections.render(
+            self._contents,
+            self._append_register_rows,
+            "register",
+            self._regdef.offsets,
+            self._array_slice(),
+        )
 
-    def _append_field_section(self) -> None:
-        if self._items:
-            for item in self._items:
-                name = (
-                    item[1].name
-                    if item[0] is None
-                    else self._join(item[0].name, item[1].name)
-                )
-                section = name + (
-                    f" : {', '.join(field.name for field in item[1].fields)}"
-                    if item[1].fields
-                    else ""
-                )
+    def _append_register_rows(self) -> None:
+        self._append_rows(self._offset_rows())
+        self._append_rows(self._register_rows())
 
-                self._append_section_header(section)
+    def _append_array_section(self) -> None:
+        self._sections.render(
+            self._contents, self._append_array_rows, "array", self._array_slice()
+        )
 
-                item_bits = (
-                    32
-                    if Opt.Bit32 in item[1].opts
-                    else (64 if Opt.Bit64 in item[1].opts else None)
-                )
+    def _array_slice(self) -> List[Tuple[str, List[ArrayRange], List[Offset]]]:
+        return [
+            (array.name, array.ranges, array.groups) for array in self._regdef.arrays
+        ]
 
-                if item[1].fields:
-                    self._append("")
-                    self._append("#ifndef __ASSEMBLY__")
+    def _append_array_rows(self) -> None:
+        if self._regdef.arrays:
+            self._append_section_header("Array Section")
 
-                    union = Str(f"union {name} " + "{")
-                    union.append_line(f"\t{self._variable('raw', bits=item_bits)};")
-                    union.append_line("")
-                    union.append_line("\tstruct {")
+        self._append_rows(self._array_num_rows())
+        self._append_rows(self._array_register_rows())
+        self._append_rows(self._array_step_rows())
+        self._append_rows(self._array_segment_rows())
 
-                    rows = []
+    def _append_field_section(self) -> None:
+        for item in self._regdef.groups:
+            self._sections.render(
+                self._contents,
+                lambda: self._append_field_item(item),
+                "field",
+                None if item[0] is None else item[0].name,
+                item[1],
+            )
 
-                    curr = 0
-                    reserved = 0
-                    for field in item[1].fields:
-                        start = field.bits[1]
-                        end = field.bits[0]
+    def _append_field_item(self, item: Tuple[Optional[Array], Offset]) -> None:
+        name = (
+            item[1].name if item[0] is None else self._join(item[0].name, item[1].name)
+        )
+        section = name + (
+            f" : {', '.join(field.name for field in item[1].fields)}"
+            if item[1].fields
+            else ""
+        )
 
-                        if curr != start:
-                            rows.append([f"RSVD{reserved}", str(start - curr)])
-                            reserved += 1
+        self._append_section_header(section)
 
-                        rows.append([field.name, end - start + 1])
+        item_bits = (
+            32
+            if Opt.Bit32 in item[1].opts
+            else (64 if Opt.Bit64 in item[1].opts else None)
+        )
 
-                        curr = end + 1
+        if item[1].fields:
+            self._append("")
+            self._append("#ifndef __ASSEMBLY__")
 
-                    if curr != self._config.bits:
-                        rows.append([f"RSVD{reserved}", str(self._config.bits - curr)])
+            union = Str(f"union {name} " + "{")
+            union.append_line(f"\t{self._variable('raw', bits=item_bits)};")
+            union.append_line("")
+            union.append_line("\tstruct {")
 
-                    union.append(
-                        Str.from_rows(
-                            [
-                                [
-                                    self._variable(row[0], bits=item_bits),
-                                    ":",
-                                    str(row[1]) + ";",
-                                ]
-                                for row in rows
-                            ]
-                        ).add_prefix("\t\t")
+            segments = sorted(
+                [
+                    (
+                        field.bits[1],
+                        field.name,
+                        field.bits[0] - field.bits[1] + 1,
                     )
+                    for field in item[1].fields
+                ]
+                + [
+                    (start, None, str(width))
+                    for start, width in item[1].reserved(self._config.bits)
+                ],
+                key=lambda segment: segment[0],
+            )
 
-                    union.append_line("\t};")
-                    union.append_line("};")
+            rows = []
 
-                    self._append_str(union)
-                    self._append("#endif")
+            reserved = 0
+            for _, field_name, width in segments:
+                if field_name is None:
+                    field_name = f"RSVD{reserved}"
+                    reserved += 1
 
-                    for field in item[1].fields:
-                        field_name = self._join(name, field.name)
-                        self._append("")
-                        self._append(f"// {self._name(field_name)}")
+                rows.append([field_name, width])
 
-                        self._append("")
-                        self._append_str(
-                            Str.from_rows(
-                                [
-                                    [
-                                        "#define",
-                                        self._name(
-                                            field_name, tails=[self._config.mask]
-                                        ),
-                                        self._value(
-                                            (
-                                                (
-                                                    1
-                                                    << (
-                                                        field.bits[0]
-                                                        - field.bits[1]
-                                                        + 1
-                                                    )
-                                                )
-                                                - 1
-                                            )
-                                            << field.bits[1],
-                                            bits=item_bits,
-                                        ),
-                                    ],
-                                    [
-                                        "#define",
-                                        self._name(
-                                            field_name, tails=[self._config.shift]
-                                        ),
-                                        f"( {field.bits[1]} )",
-                                    ],
-                                ]
-                            )
-                        )
+            union.append(
+                Str.from_rows(
+                    [
+                        [
+                            self._variable(row[0], bits=item_bits),
+                            ":",
+                            str(row[1]) + ";",
+                        ]
+                        for row in rows
+                    ]
+                ).add_prefix("\t\t")
+            )
 
-                        if field.enums:
-                            self._append("")
-                            self._append_str(
-                                Str.from_rows(
-                                    [
-                                        [
-                                            "#define",
-                                            self._name(
-                                                self._join(field_name, enum.name)
-                                            ),
-                                            f"( {enum.val.value} )",
-                                        ]
-                                        for enum in field.enums
-                                    ]
-                                )
-                            )
+            union.append_line("\t};")
+            union.append_line("};")
 
-                            self._append("")
-                            self._append_str(
-                                Str.from_rows(
-                                    [
-                                        [
-                                            "#define",
-                                            self._name(
-                                                self._join(field_name, enum.name),
-                                                tails=[self._config.raw],
-                                            ),
-                                            self._value(
-                                                enum.val.value << field.bits[1],
-                                                bits=item_bits,
-                                            ),
-                                        ]
-                                        for enum in field.enums
-                                    ]
-                                )
-                            )
+            self._append_str(union)
+            self._append("#endif")
 
-                    self._append("")
-                    self._append(f"// {self._name(name, tails=[self._config.raw])}")
+            for field in item[1].fields:
+                field_name = self._join(name, field.name)
+                self._append("")
+                self._append(f"// {self._name(field_name)}")
 
-                    self._append("")
-                    self._append_str(
-                        Str.from_rows(
+                self._append("")
+                self._append_str(
+                    Str.from_rows(
+                        [
                             [
-                                [
-                                    "#define",
-                                    f"{self._name(self._join(name, field.name), tails=[self._config.raw])}({field.name.lower()})",
-                                    f"( ( {field.name.lower()}",
-                                    "<<",
-                                    self._name(
-                                        self._join(name, field.name),
-                                        tails=[self._config.shift],
-                                    ),
-                                    ") &",
-                                    self._name(
-                                        self._join(name, field.name),
-                                        tails=[self._config.mask],
-                                    ),
-                                    ")",
-                                ]
-                                for field in item[1].fields
-                            ]
-                        )
-                    )
-
-                    self._append("")
-                    self._append(
-                        f"#define {self._name(name, tails=[self._config.raw])}"
-                        + f"({', '.join(field.name.lower() for field in item[1].fields)})"
-                        + f" ( {' | '.join(f'{self._name(self._join(name, field.name), tails=[self._config.raw])}({field.name.lower()})' for field in item[1].fields)} )"
+                                "#define",
+                                self._name(field_name, tails=[self._config.mask]),
+                                self._value(
+                                    ((1 << (field.bits[0] - field.bits[1] + 1)) - 1)
+                                    << field.bits[1],
+                                    bits=item_bits,
+                                ),
+                            ],
+                            [
+                                "#define",
+                                self._name(field_name, tails=[self._config.shift]),
+                                f"( {field.bits[1]} )",
+                            ],
+                        ]
                     )
+                )
 
+                if field.enums:
                     self._append("")
                     self._append_str(
                         Str.from_rows(
                             [
                                 [
                                     "#define",
-                                    f"{self._name(self._join(name, field.name), tails=[self._config.value])}({self._config.raw.lower()})",
-                                    f"( ( {self._config.raw.lower()}",
-                                    "&",
-                                    self._name(
-                                        self._join(name, field.name),
-                                        tails=[self._config.mask],
-                                    ),
-                                    ") >>",
-                                    self._name(
-                                        self._join(name, field.name),
-                                        tails=[self._config.shift],
-                                    ),
-                                    ")",
+                                    self._name(self._join(field_name, enum.name)),
+                                    f"( {enum.val} )",
                                 ]
-                                for field in item[1].fields
+                                for enum in field.enums
                             ]
                         )
                     )
 
-                else:
-                    self._append("")
-                    self._append(
-                        f"// {self._name(name, tails=[self._config.raw])} : NO FIELD"
-                    )
-
                     self._append("")
                     self._append_str(
                         Str.from_rows(
                             [
                                 [
                                     "#define",
-                                    f"{self._name(name, tails=[self._config.raw])}()",
+                                    self._name(
+                                        self._join(field_name, enum.name),
+                                        tails=[self._config.raw],
+                                    ),
                                     self._value(
-                                        0,
+                                        enum.val << field.bits[1],
                                         bits=item_bits,
                                     ),
                                 ]
+                                for enum in field.enums
                             ]
                         )
                     )
 
+            self._append("")
+            self._append(f"// {self._name(name, tails=[self._config.raw])}")
+
+            self._append("")
+            self._append_str(
+                Str.from_rows(
+                    [
+                        [
+                            "#define",
+                            f"{self._name(self._join(name, field.name), tails=[self._config.raw])}({field.name.lower()})",
+                            f"( ( {field.name.lower()}",
+                            "<<",
+                            self._name(
+                                self._join(name, field.name),
+                                tails=[self._config.shift],
+                            ),
+                            ") &",
+                            self._name(
+                                self._join(name, field.name),
+                                tails=[self._config.mask],
+                            ),
+                            ")",
+                        ]
+                        for field in item[1].fields
+                    ]
+                )
+            )
+
+            self._append("")
+            self._append(
+                f"#define {self._name(name, tails=[self._config.raw])}"
+                + f"({', '.join(field.name.lower() for field in item[1].fields)})"
+                + f" ( {' | '.join(f'{self._name(self._join(name, field.name), tails=[self._config.raw])}({field.name.lower()})' for field in item[1].fields)} )"
+            )
+
+            self._append("")
+            self._append_str(
+                Str.from_rows(
+                    [
+                        [
+                            "#define",
+                            f"{self._name(self._join(name, field.name), tails=[self._config.value])}({self._config.raw.lower()})",
+                            f"( ( {self._config.raw.lower()}",
+                            "&",
+                            self._name(
+                                self._join(name, field.name),
+                                tails=[self._config.mask],
+                            ),
+                            ") >>",
+                            self._name(
+                                self._join(name, field.name),
+                                tails=[self._config.shift],
+                            ),
+                            ")",
+                        ]
+                        for field in item[1].fields
+                    ]
+                )
+            )
+
+        else:
+            self._append("")
+            self._append(f"// {self._name(name, tails=[self._config.raw])} : NO FIELD")
+
+            self._append("")
+            self._append_str(
+                Str.from_rows(
+                    [
+                        [
+                            "#define",
+                            f"{self._name(name, tails=[self._config.raw])}()",
+                            self._value(
+                                0,
+                                bits=item_bits,
+                            ),
+                        ]
+                    ]
+                )
+            )
+
     def _append_close_header_guard(self) -> None:
         guard = self._config.guard + "_H"
 
         self._append("")
         self._append(f"#endif // {guard}")
 
-    def _write(self, file: WriteFile) -> None:
-        file.write(self._contents)
-
     def _join(self, *tokens) -> str:
         return "_".join(tokens)
 
@@ -597,9 +565,7 @@ class RegCHeader(RegGen):
             bits = self._config.bits
 
         return (
-            f"UL({value.get_aligned(8)})"
-            if bits == 32
-            else f"ULL({value.get_aligned(16)})"
+            value.get_wrapped("UL", 8) if bits == 32 else value.get_wrapped("ULL", 16)
         )
 
     def _variable(self, value: str, bits: Optional[int] = None) -> str:
@@ -1,11 +1,10 @@
 from typing import List, Optional, Union
 
-from infos import reggen_name, reggen_version
-from inc import WriteFile, Str, HexStr, IntStr
+from inc import WriteFile, SectionCache, Str, Sink, Table, HexStr, IntStr
 
 from src.Reg.RegGen import RegGen
 from src.Reg.RegConfig import RegConfig
-from src.Reg.RegDef import RegDef, Offset, Opt
+from src.Reg.RegDef import RegDef, Register, _Field
 
 
 class RegCTestHeader(RegGen):
@@ -15,209 +14,33 @@ class RegCTestHeader(RegGen):
         self._regdef = regdef
         self._config = config
 
-        self._contents = ""
-
-    def generate(self, file: WriteFile) -> None:
-        self._set_offsets()
-        self._set_reset_value_config_rows()
-        self._set_ro_config_rows()
-        self._set_rw_config_rows()
-        self._set_row_headers()
-
-        if not self._config.annotation:
-            self._remove_annotations()
-
-        self._append_note_header()
-        self._append_open_header_guard()
-        self._append_includes()
-
-        self._append_reset_value_config_section()
-        self._append_ro_config_section()
-        self._append_rw_config_section()
-
-        self._append_close_header_guard()
-
-        self._write(file)
-
-    def _set_offsets(self) -> None:
-        self._offsets = []
-
-        for offset in self._regdef.offsets:
-            self._offsets.append([offset, offset, None])
-
-        for array in self._regdef._arrays:
-            for offset in array.offsets:
-                for group in array.groups:
-                    self._offsets.append(
-                        [
-                            Offset(
-                                self._join(array.name, offset.name, group.name),
-                                HexStr.from_int(
-                                    offset.offset.value + group.offset.value
-                                ),
-                            ),
-                            group,
-                            array,
-                        ]
-                    )
+        self._contents = Sink()
 
-        self._offsets.sort(key=lambda offset: offset[0])
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
+        self._set_config_tables()
 
-    def _set_reset_value_config_rows(self) -> None:
-        self._reset_value_config_rows = []
+        with file.open() as sink:
+            self._contents = sink
 
-        for offset, offset_field, array in self._offsets:
-            bits = (
-                32
-                if Opt.Bit32 in offset_field.opts
-                else (64 if Opt.Bit64 in offset_field.opts else self._config.bits)
-            )
+            self._append_note_header()
+            self._append_open_header_guard()
+            self._append_includes()
 
-            if any(field.reset is not None for field in offset_field.fields):
-                raw = sum(
-                    field.reset.value << field.bits[1]
-                    for field in offset_field.fields
-                    if field.reset is not None
-                )
-                mask = sum(
-                    ((1 << (field.bits[0] - field.bits[1] + 1)) - 1) << field.bits[1]
-                    for field in offset_field.fields
-                    if field.reset is not None
-                )
+            self._append_reset_value_config_section()
+            self._append_ro_config_section()
+            self._append_rw_config_section()
 
-                self._reset_value_config_rows.append(
-                    [
-                        "{",
-                        f"{self._address(offset.offset)},",
-                        f"{str(bits)},",
-                        ".raw = { .u" + str(bits) + " =",
-                        f"{self._value(raw, bits=bits)}",
-                        "},",
-                        ".mask = { .u" + str(bits) + " =",
-                        f"{self._value(mask, bits=bits)}",
-                        "}",
-                        "},",
-                        "//",
-                        (
-                            offset.name
-                            if array is None
-                            else self._join(array.name, offset_field.name)
-                        ),  # ID
-                        "|",
-                        ", ".join(
-                            field.name
-                            for field in offset_field.fields
-                            if field.reset is not None
-                        ),  # Field
-                        # "|",
-                        # ", ".join(
-                        #     field.name
-                        #     for field in offset_field.fields
-                        #     if field.reset is None
-                        # ),  # Field(No Reset Value)
-                    ]
-                )
+            self._append_close_header_guard()
 
-    def _set_ro_config_rows(self) -> None:
-        self._ro_config_rows = []
+    def _set_config_tables(self) -> None:
+        self._reset_value_config_table = Table.spool()
+        self._ro_config_table = Table.spool()
+        self._rw_config_table = Table.spool()
 
-        for offset, offset_field, array in self._offsets:
-            bits = (
-                32
-                if Opt.Bit32 in offset_field.opts
-                else (64 if Opt.Bit64 in offset_field.opts else self._config.bits)
-            )
-
-            for field in offset_field.fields:
-                if field.access is not None and field.access == "RO":
-                    raws = []
-                    raws.append(
-                        (field.enums[0].val.value << field.bits[1])
-                        if field.enums
-                        else 0
-                    )
-                    raws.append(
-                        (field.enums[1].val.value << field.bits[1])
-                        if 1 < len(field.enums)
-                        else (raws[0] + (1 << field.bits[1]))
-                    )
-
-                    self._ro_config_rows.append(
-                        [
-                            "{",
-                            f"{self._address(offset.offset)},",
-                            f"{str(bits)},",
-                            ".write_raws = { { .u" + str(bits) + " =",
-                            f"{self._value(raws[0], bits=bits)}",
-                            "}, { .u" + str(bits) + " =",
-                            f"{self._value(raws[1], bits=bits)}",
-                            "} },",
-                            ".ro_mask = { .u" + str(bits) + " =",
-                            f"{self._value(((1 << (field.bits[0] - field.bits[1] + 1)) - 1) << field.bits[1], bits=bits)}",
-                            "} },",
-                            "//",
-                            (
-                                offset.name
-                                if array is None
-                                else self._join(array.name, offset_field.name)
-                            ),  # ID
-                            "|",
-                            field.name,  # Field
-                        ]
-                    )
-
-    def _set_rw_config_rows(self) -> None:
-        self._rw_config_rows = []
-
-        for offset, offset_field, array in self._offsets:
-            bits = (
-                32
-                if Opt.Bit32 in offset_field.opts
-                else (64 if Opt.Bit64 in offset_field.opts else self._config.bits)
-            )
-
-            for field in offset_field.fields:
-                if field.access is not None and field.access == "RW":
-                    raws = []
-                    raws.append(
-                        (field.enums[0].val.value << field.bits[1])
-                        if field.enums
-                        else 0
-                    )
-                    raws.append(
-                        (field.enums[1].val.value << field.bits[1])
-                        if 1 < len(field.enums)
-                        else (raws[0] + (1 << field.bits[1]))
-                    )
-
-                    self._rw_config_rows.append(
-                        [
-                            "{",
-                            f"{self._address(offset.offset)},",
-                            f"{str(bits)},",
-                            ".write_raws = { { .u" + str(bits) + " =",
-                            f"{self._value(raws[0], bits=bits)}",
-                            "}, { .u" + str(bits) + " =",
-                            f"{self._value(raws[1], bits=bits)}",
-                            "} },",
-                            ".rw_mask = { .u" + str(bits) + " =",
-                            f"{self._value(((1 << (field.bits[0] - field.bits[1] + 1)) - 1) << field.bits[1], bits=bits)}",
-                            "} },",
-                            "//",
-                            (
-                                offset.name
-                                if array is None
-                                else self._join(array.name, offset_field.name)
-                            ),  # ID
-                            "|",
-                            field.name,  # Field
-                        ]
-                    )
-
-    def _set_row_headers(self) -> None:
-        if self._reset_value_config_rows:
-            self._reset_value_config_rows.insert(
-                0,
+        if self._config.annotation:
+            self._reset_value_config_table.append(
                 [
                     "",
                     "",
@@ -235,59 +58,129 @@ class RegCTestHeader(RegGen):
                     "Field",
                     # "|",
                     # "Field(No Reset Value)",
-                ],
+                ]
             )
 
-            # if all(not row[15] for row in self._reset_value_config_rows[1:]):
-            #     for row in self._reset_value_config_rows:
-            #         del row[14]
-            #         del row[14]
+            for table in [self._ro_config_table, self._rw_config_table]:
+                table.append(
+                    [
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+                        "//",
+                        "ID",
+                        "|",
+                        "Field",
+                    ]
+                )
 
-        for rows in [self._ro_config_rows, self._rw_config_rows]:
-            rows.insert(
-                0,
-                [
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "//",
-                    "ID",
-                    "|",
-                    "Field",
-                ],
-            )
+        for register in self._regdef.registers:
+            if (row := self._reset_value_config_row(register)) is not None:
+                self._reset_value_config_table.append(self._annotated(row, 10))
+
+            for field in register.fields:
+                if field.access is not None and field.access == "RO":
+                    self._ro_config_table.append(
+                        self._annotated(self._access_config_row(register, field), 11)
+                    )
+
+                elif field.access is not None and field.access == "RW":
+                    self._rw_config_table.append(
+                        self._annotated(self._access_config_row(register, field), 11)
+                    )
+
+    def _reset_value_config_row(self, register: Register) -> Optional[List[str]]:
+        if not any(field.reset is not None for field in register.fields):
+            return None
+
+        bits = register.width(self._config.bits)
+
+        raw = sum(
+            field.reset << field.bits[1]
+            for field in register.fields
+            if field.reset is not None
+        )
+        mask = sum(
+            ((1 << (field.bits[0] - field.bits[1] + 1)) - 1) << field.bits[1]
+            for field in register.fields
+            if field.reset is not None
+        )
 
-    def _remove_annotations(self) -> None:
-        for rows, start in [
-            [self._reset_value_config_rows, 10],
-            [self._ro_config_rows, 11],
-            [self._rw_config_rows, 11],
-        ]:
-            if rows:
-                del rows[0]
+        return [
+            "{",
+            f"{self._address(register.offset)},",
+            f"{str(bits)},",
+            ".raw = { .u" + str(bits) + " =",
+            f"{self._value(raw, bits=bits)}",
+            "},",
+            ".mask = { .u" + str(bits) + " =",
+            f"{self._value(mask, bits=bits)}",
+            "}",
+            "},",
+            "//",
+            register.keyword,  # ID
+            "|",
+            ", ".join(
+                field.name for field in register.fields if field.reset is not None
+            ),  # Field
+            # "|",
+            # ", ".join(
+            #     field.name
+            #     for field in register.fields
+            #     if field.reset is None
+            # ),  # Field(No Reset Value)
+        ]
+
+    def _access_config_row(self, register: Register, field: _Field) -> List[str]:
+        bits = register.width(self._config.bits)
+
+        raws = []
+        raws.append((field.enums[0].val << field.bits[1]) if field.enums else 0)
+        raws.append(
+            (field.enums[1].val << field.bits[1])
+            if 1 < len(field.enums)
+            else (raws[0] + (1 << field.bits[1]))
+        )
 
-            for row in rows:
-                for _ in range(start, len(row)):
-                    del row[start]
+        return [
+            "{",
+            f"{self._address(register.offset)},",
+            f"{str(bits)},",
+            ".write_raws = { { .u" + str(bits) + " =",
+            f"{self._value(raws[0], bits=bits)}",
+            "}, { .u" + str(bits) + " =",
+            f"{self._value(raws[1], bits=bits)}",
+            "} },",
+            f".{field.access.lower()}_mask = {{ .u" + str(bits) + " =",
+            f"{self._value(((1 << (field.bits[0] - field.bits[1] + 1)) - 1) << field.bits[1], bits=bits)}",
+            "} },",
+            "//",
+            register.keyword,  # ID
+            "|",
+            field.name,  # Field
+        ]
+
+    def _annotated(self, row: List[str], start: int) -> List[str]:
+        return row if self._config.annotation else row[:start]
 
     def _append(self, c: str) -> None:
-        self._contents += c + "\n"
+        self._contents.append_line(c)
 
     def _append_str(self, s: Str) -> None:
-        self._append(str(s))
+        for line in s.lines:
+            self._append(line)
 
     def _append_note_header(self) -> None:
-        self._append(f"// Do not edit!")
-        self._append(f"// This is generated by {reggen_name} {reggen_version}")
-        self._append(f"// RegDef hash({self._regdef.file.hash})")
+        for line in self.fingerprint(self._regdef.file, self._config):
+            self._append(line)
 
         if self._config.notes:
             self._append("")
@@ -306,43 +199,35 @@ class RegCTestHeader(RegGen):
         self._append("#include <stdint.h>")
         self._append("#include <test_regs.h>")
 
+    def _append_config_section(self, struct: str, table: Table, empty: bool) -> None:
+        if len(table) == (1 if self._config.annotation else 0) and not (
+            empty and self._config.annotation
+        ):
+            return
+
+        self._append("")
+        self._append(
+            f"struct test_regs_{struct}_config test"
+            + (f"_{self._config.name.lower()}" if self._config.name else "")
+            + f"_regs_{struct}_configs[] = "
+            + "{"
+        )
+
+        for line in table.lines():
+            self._append("\t" + line)
+
+        self._append("};")
+
     def _append_reset_value_config_section(self) -> None:
-        if self._reset_value_config_rows:
-            self._append("")
-            self._append(
-                f"struct test_regs_{self._config.reset.lower()}_config test"
-                + (f"_{self._config.name.lower()}" if self._config.name else "")
-                + f"_regs_{self._config.reset.lower()}_configs[] = "
-                + "{"
-            )
-            self._append_str(
-                Str.from_rows(self._reset_value_config_rows).add_prefix("\t")
-            )
-            self._append("};")
+        self._append_config_section(
+            self._config.reset.lower(), self._reset_value_config_table, False
+        )
 
     def _append_ro_config_section(self) -> None:
-        if self._ro_config_rows:
-            self._append("")
-            self._append(
-                f"struct test_regs_ro_config test"
-                + (f"_{self._config.name.lower()}" if self._config.name else "")
-                + f"_regs_ro_configs[] = "
-                + "{"
-            )
-            self._append_str(Str.from_rows(self._ro_config_rows).add_prefix("\t"))
-            self._append("};")
+        self._append_config_section("ro", self._ro_config_table, True)
 
     def _append_rw_config_section(self) -> None:
-        if self._rw_config_rows:
-            self._append("")
-            self._append(
-                f"struct test_regs_rw_config test"
-                + (f"_{self._config.name.lower()}" if self._config.name else "")
-                + f"_regs_rw_configs[] = "
-                + "{"
-            )
-            self._append_str(Str.from_rows(self._rw_config_rows).add_prefix("\t"))
-            self._append("};")
+        self._append_config_section("rw", self._rw_config_table, True)
 
     def _append_section_header(self, section: str) -> None:
         self._append("")
@@ -354,9 +239,6 @@ class RegCTestHeader(RegGen):
         self._append("")
         self._append(f"#endif // {guard}")
 
-    def _write(self, file: WriteFile) -> None:
-        file.write(self._contents)
-
     def _join(self, *tokens) -> str:
         return "_".join(tokens)
 
@@ -395,9 +277,7 @@ class RegCTestHeader(RegGen):
             bits = self._config.bits
 
         return (
-            f"UL({value.get_aligned(8)})"
-            if bits == 32
-            else f"ULL({value.get_aligned(16)})"
+            value.get_wrapped("UL", 8) if bits == 32 else value.get_wrapped("ULL", 16)
         )
 
     def _variable(self, value: str, bits: Optional[int] = None) -> str:
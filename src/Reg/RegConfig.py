@@ -1,5 +1,6 @@
-from typing import Final, Dict, Optional, Type, Tuple
+from typing import Final, Dict, List, Optional, Type, Tuple
 from argparse import Namespace
+from hashlib import sha256
 
 from inc import InvalidError, NotExistError
 from inc import Str
@@ -100,6 +101,10 @@ class RegConfig:
         self._invalid_args(args)
         self._set_args(args)
 
+    @classmethod
+    def keys(cls) -> List[str]:
+        return list(cls._rules.keys())
+
     def __str__(self) -> str:
         return Str.from_rows(
             [
@@ -112,6 +117,18 @@ class RegConfig:
             separator=" : ",
         ).contents
 
+    def fingerprint(self, gen: str) -> str:
+        return sha256(
+            repr(
+                [gen]
+                + [
+                    (name, getattr(self, name))
+                    for name in RegConfig._rules.keys()
+                    if name != "debug"
+                ]
+            ).encode()
+        ).hexdigest()
+
     @property
     def name(self) -> str:
         return self._name
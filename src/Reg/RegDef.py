@@ -1,6 +1,8 @@
-from typing import List, Union, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from enum import Enum
 from re import match
+from sys import intern
+from heapq import merge
 
 from inc import (
     InvalidError,
@@ -8,7 +10,17 @@ from inc import (
     NotExistError,
     NotExpectedError,
 )
-from inc import ReadFile, Str, HexStr, IntStr
+from inc import (
+    ReadFile,
+    ModelCache,
+    Str,
+    HexStr,
+    IntStr,
+    SymbolTable,
+    ArrayRange,
+    ArrayBase,
+    IntervalIndex,
+)
 
 from src.Reg.RegConfig import RegConfig
 
@@ -50,6 +62,12 @@ class _Kind(Enum):
     ATTRIBUTE = "attribute,^"
 
 
+class _Symbol(Enum):
+    OFFSET = "offset"
+    ARRAY = "array"
+    GROUP = "group"
+
+
 class Opt(Enum):
     Bit32 = "-32"
     Bit64 = "-64"
@@ -64,22 +82,14 @@ class RegDef:
         self._offsets: List[Offset] = []
         self._arrays: List[Array] = []
 
-        keys, rows = file.csv_contents
-
-        for key in _Key:
-            if key.value not in keys:
-                raise NotExistError(
-                    "Key",
-                    f"{key.value} is not exist for CSV"
-                    + f": keys({', '.join(key.value for key in _Key)})",
-                )
-
-        rows = [_Row(*[row[keys.index(key.value)] for key in _Key]) for row in rows]
+        self._symbols = SymbolTable()
 
         offset = None
         field = None
 
-        for row in rows:
+        for line, row in file.csv_rows([key.value for key in _Key]):
+            row = _Row(line, *row)
+
             item = {
                 _Kind.OFFSET: self._offset,
                 _Kind.ARRAY: self._array,
@@ -94,8 +104,32 @@ class RegDef:
             elif isinstance(item, _Field):
                 field = item
 
-        self._offsets = sorted(self._offsets)
-        self._arrays = sorted(self._arrays)
+        for offset in self._offsets:
+            offset.finalize()
+
+        for array in self._arrays:
+            array.finalize()
+
+        self._offsets.sort()
+        self._arrays.sort()
+
+        self._validate()
+
+    @classmethod
+    def cached(
+        cls, file: ReadFile, config: RegConfig, cache: Optional[ModelCache]
+    ) -> "RegDef":
+        if cache is None:
+            return cls(file, config)
+
+        if (regdef := cache.load(file)) is None:
+            regdef = cls(file, config)
+            cache.store(file, regdef)
+
+        else:
+            regdef._file = file
+
+        return regdef
 
     def print(self) -> None:
         print(
@@ -147,15 +181,13 @@ class RegDef:
                                 for offset, group in [
                                     (
                                         Offset(
-                                            f"{array.name}_{offset.name}_{group.name}",
-                                            HexStr.from_int(
-                                                offset.offset.value + group.offset.value
-                                            ),
+                                            f"{array.name}_{index}_{group.name}",
+                                            HexStr.from_int(value + group.offset.value),
                                         ),
                                         group,
                                     )
                                     for array in self._arrays
-                                    for offset in array.offsets
+                                    for index, value in array.elements
                                     for group in array.groups
                                 ]
                             ]
@@ -180,18 +212,51 @@ class RegDef:
     def arrays(self) -> List["Array"]:
         return self._arrays
 
+    @property
+    def registers(self) -> Iterator["Register"]:
+        return merge(
+            (Register(offset, offset) for offset in self._offsets),
+            *(
+                self._registers(array, group)
+                for array in self._arrays
+                for group in array.groups
+            ),
+            key=lambda register: register.offset.value,
+        )
+
+    @property
+    def groups(self) -> Iterator[Tuple[Optional["Array"], "Offset"]]:
+        return merge(
+            ((None, offset) for offset in self._offsets),
+            (
+                (array, group)
+                for array in sorted(self._arrays, key=lambda array: not array.ranges)
+                for group in array.groups
+            ),
+            key=lambda group: (
+                group[1].offset.value
+                if group[0] is None
+                else (
+                    group[0].first.offset.value
+                    if group[0].ranges
+                    else 0xFFFFFFFFFFFFFFFF
+                )
+            ),
+        )
+
     def _offset(
         self,
         row: "_Row",
         _: Optional["Offset"],
         field: Optional["_Field"],
     ) -> "Offset":
-        if row.name in [offset.name for offset in self._offsets]:
+        if self._symbols.exists(row.name, _Symbol.OFFSET) or self._element(row.name):
             raise DuplicatedError("Name", row.name)
 
         offset = Offset(row.name, row.value, row.opts)
 
         self._offsets.append(offset)
+        self._symbols.register(_Symbol.OFFSET, offset.name, offset)
 
         return offset
 
@@ -201,14 +266,13 @@ class RegDef:
         _: Optional["Offset"],
         field: Optional["_Field"],
     ) -> None:
-        for array in self._arrays:
-            if array.name == row.name:
-                break
+        array = self._symbols.find(_Symbol.ARRAY, row.name)
 
-        else:
+        if array is None:
             array = Array(row.name)
 
             self._arrays.append(array)
+            self._symbols.register(_Symbol.ARRAY, array.name, array)
 
         tokens = row.define.split(",")
         if len(tokens) != 3 and len(tokens) != 4:
@@ -230,29 +294,22 @@ class RegDef:
                 + f": step is zero, but count({count}) is greater than 1",
             )
 
-        offset = HexStr(row.value)
-        array_offsets = [
-            Offset(
-                str(index),
-                f"0x{(int(offset, 16) + (int(step, 16) * (index - int(start)))):X}",
-                row.opts,
-            )
-            for index in range(int(start), int(start) + int(count))
-        ]
-
-        for offset in array_offsets:
-            if f"{array.name}_{offset.name}" in (
-                [offset_.name for offset_ in self._offsets]
-                + [
-                    f"{array_.name}_{offset_.name}"
-                    for array_ in self._arrays
-                    for offset_ in array_.offsets
-                ]
-            ):
-                raise DuplicatedError("Name", offset.name)
+        range_ = ArrayRange(
+            HexStr(row.value).value, start.value, count.value, step.value
+        )
+
+        for other in array.ranges:
+            if range_.overlaps(other):
+                raise DuplicatedError(
+                    "Name", f"{array.name}_{max(range_.start, other.start)}"
+                )
+
+        for index in range_.indexes:
+            if self._symbols.exists(name := f"{array.name}_{index}", _Symbol.OFFSET):
+                raise DuplicatedError("Name", name)
 
-        for offset in array_offsets:
-            array.append_offset(offset)
+        if range_.count:
+            array.extend([range_])
 
     def _group(
         self,
@@ -268,23 +325,115 @@ class RegDef:
                 f"invalid number of tokens in define: expected 2",
             )
 
-        array_name = tokens[1]
-        for array in self._arrays:
-            if array.name == array_name:
-                break
+        array = self._symbols.find(_Symbol.ARRAY, tokens[1])
 
-        else:
-            raise DuplicatedError("Name", tokens[1])
+        if array is None:
+            raise NotExistError(
+                "Array",
+                f"{tokens[1]} is not exist to register {row.name}",
+            )
 
-        if row.name in [group.name for group in array._groups]:
+        if self._symbols.exists(row.name, _Symbol.GROUP, scope=array.name):
             raise DuplicatedError("Name", row.name)
 
         offset = Offset(row.name, row.value, row.opts)
 
         array.append_group(offset)
+        self._symbols.register(_Symbol.GROUP, offset.name, offset, scope=array.name)
 
         return offset
 
+    def _validate(self) -> None:
+        index = IntervalIndex()
+        misaligned = []
+
+        width = lambda offset: Register(offset, offset).width(32) // 8
+        name = lambda item, element: (
+            item[0]
+            if item[1] is None
+            else self._join(item[0], str(item[1] + element), item[2])
+        )
+
+        for offset in self._offsets:
+            start = offset.offset.value
+
+            index.append(start, start + width(offset), (offset.name, None))
+
+            if start % width(offset):
+                misaligned.append((offset.name, start, width(offset)))
+
+        for array in self._arrays:
+            for range_ in array.ranges:
+                for group in array.groups:
+                    start = range_.base + group.offset.value
+                    item = (array.name, range_.start, group.name)
+
+                    index.append_progression(
+                        start,
+                        start + width(group),
+                        item,
+                        range_.step,
+                        range_.count,
+                    )
+
+                    if start % width(group):
+                        misaligned.append((name(item, 0), start, width(group)))
+
+                    elif 1 < range_.count and range_.step % width(group):
+                        misaligned.append(
+                            (name(item, 1), start + range_.step, width(group))
+                        )
+
+        if pairs := index.overlaps():
+            raise DuplicatedError(
+                "Offset",
+                ", ".join(f"{name(*a[:2])}, {name(*b[:2])}" for a, b in pairs[:1]),
+                f"{len(pairs)} collided pair(s)"
+                + "".join(
+                    f"\n      {name(*a[:2])}({HexStr.from_int(a[2])})"
+                    + f" & {name(*b[:2])}({HexStr.from_int(b[2])})"
+                    for a, b in pairs
+                ),
+            )
+
+        if misaligned:
+            raise InvalidError(
+                "Align",
+                misaligned[0][0],
+                f"{len(misaligned)} offset(s) not aligned to register width"
+                + "".join(
+                    f"\n      {offset}({HexStr.from_int(start)}): {bytes * 8} bits"
+                    for offset, start, bytes in misaligned
+                ),
+            )
+
+    def _registers(self, array: "Array", group: "Offset") -> Iterator["Register"]:
+        for index, value in array.elements:
+            yield Register(
+                Offset(
+                    self._join(array.name, str(index), group.name),
+                    HexStr.from_int(value + group.offset.value),
+                ),
+                group,
+                array,
+            )
+
+    def _join(self, *tokens) -> str:
+        return "_".join(tokens)
+
+    def _element(self, name: str) -> Optional["Offset"]:
+        tokens = name.rsplit("_", 1)
+        if (
+            len(tokens) != 2
+            or not tokens[1].isdigit()
+            or tokens[1] != str(int(tokens[1]))
+        ):
+            return None
+
+        array = self._symbols.find(_Symbol.ARRAY, tokens[0])
+
+        return array.get(int(tokens[1])) if array is not None else None
+
     def _attribute(
         self,
         row: "_Row",
@@ -350,15 +499,11 @@ class RegDef:
         if any(bit < 0 or bit > 31 for bit in bits):
             raise InvalidError("Bits", row.bits, "token of bits should be in 0 to 31")
 
-        if any(
-            field.bits[0] >= bits[0] >= field.bits[1]
-            or field.bits[0] >= bits[1] >= field.bits[1]
-            for field in offset.fields
-        ):
-            raise DuplicatedError("Bits", row.bits)
-
         field_ = _Field(row.field, bits, row.access, row.reset)
 
+        if offset.mask & field_.mask:
+            raise DuplicatedError("Bits", row.bits)
+
         offset.append(field_)
 
         return field_
@@ -390,10 +535,10 @@ class RegDef:
 
         enum = _Enum(row.enum, row.val)
 
-        if any(e.val.value == enum.val.value for e in field.enums):
+        if any(e.val == enum.val for e in field.enums):
             raise DuplicatedError(
                 "Val",
-                enum.val,
+                row.val,
                 f"field({field.name}) has duplicated vals",
             )
 
@@ -401,8 +546,24 @@ class RegDef:
 
 
 class _Row:
+    __slots__ = (
+        "_line",
+        "_name",
+        "_value",
+        "_define",
+        "_field",
+        "_bits",
+        "_access",
+        "_reset",
+        "_enum",
+        "_val",
+        "_kind",
+        "_opts",
+    )
+
     def __init__(
         self,
+        line: int,
         name: str,
         value: str,
         define: str,
@@ -436,11 +597,12 @@ class _Row:
             raise InvalidError(
                 "Kind",
                 defined_kind,
-                f"name({name}), define({define})"
+                f"line({line}), name({name}), define({define})"
                 + f": kind should be one of these types"
                 + f": {', '.join({token for kind in _Kind for token in kind.value.strip().split(',')})}",
             )
 
+        self._line = line
         self._name = name if name else None
         self._value = value if value else None
         self._define = define
@@ -457,7 +619,7 @@ class _Row:
                     raise InvalidError(
                         "CSV Row",
                         ",".join([name, define, field, bits, enum, value]),
-                        "all cell of defined keys for offset or array or group should be exist"
+                        f"line({line}): all cell of defined keys for offset or array or group should be exist"
                         + f": keys({', '.join(key.value for key in _OffsetKey)})",
                     )
 
@@ -469,7 +631,7 @@ class _Row:
                         raise InvalidError(
                             "CSV Row",
                             ",".join([name, define, field, bits, enum, value]),
-                            "all cell of defined keys for field should be exist"
+                            f"line({line}): all cell of defined keys for field should be exist"
                             + f": keys({', '.join(key for key in field_keys)})",
                         )
 
@@ -481,7 +643,7 @@ class _Row:
                         raise InvalidError(
                             "CSV Row",
                             ",".join([name, define, field, bits, enum, value]),
-                            "all cell of defined keys for enum should be exist"
+                            f"line({line}): all cell of defined keys for enum should be exist"
                             + f": keys({', '.join(key.value for key in _EnumKey)})",
                         )
 
@@ -495,6 +657,10 @@ class _Row:
 
         self._opts = [Opt(opt) for opt in opts]
 
+    @property
+    def line(self) -> int:
+        return self._line
+
     @property
     def name(self) -> str:
         if self._name is None:
@@ -556,12 +722,16 @@ class _Row:
 
 
 class Offset:
+    __slots__ = ("_name", "_offset", "_opts", "_fields", "_mask", "_finalized")
+
     def __init__(self, name: str, offset: str, opts: List[Opt] = []) -> None:
         self._name: str = name
         self._offset: HexStr = HexStr(offset)
         self._opts: List[Opt] = opts
 
         self._fields: List[_Field] = []
+        self._mask: int = 0
+        self._finalized: bool = False
 
     def __lt__(self, other: "Offset") -> bool:
         return self._offset.value < other.offset.value
@@ -582,88 +752,155 @@ class Offset:
     def fields(self) -> List["_Field"]:
         return self._fields
 
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    def reserved(self, bits: int) -> List[Tuple[int, int]]:
+        gaps = []
+
+        free = ~self._mask & ((1 << bits) - 1)
+        while free:
+            start = (free & -free).bit_length() - 1
+            width = ((free >> start) ^ ((free >> start) + 1)).bit_length() - 1
+
+            gaps.append((start, width))
+            free &= ~(((1 << width) - 1) << start)
+
+        return gaps
+
     def append(self, field: "_Field") -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Offset({self._name}): already finalized")
+
         self._fields.append(field)
+        self._mask |= field.mask
+
+    def finalize(self) -> None:
+        for field in self._fields:
+            field.finalize()
+
         self._fields.sort()
+        self._finalized = True
 
 
-class Array:
+class Array(ArrayBase):
+    __slots__ = ("_groups",)
+
     def __init__(
         self,
         name: str,
-        offsets: List[Offset] = [],
-        groups: List[Offset] = [],
+        ranges: Optional[List[ArrayRange]] = None,
+        groups: Optional[List[Offset]] = None,
     ) -> None:
-        self._name: str = name
-        self._offsets: List[Offset] = offsets
-        self._groups: List[Offset] = groups
+        super().__init__(name, ranges)
+
+        self._groups: List[Offset] = groups if groups is not None else []
 
     def __lt__(self, other: "Array") -> bool:
-        return (len(self._offsets) == 0 and len(other.offsets) != 0) or (
-            len(self._offsets) != 0
-            and len(other.offsets) != 0
-            and self._offsets[0] < other.offsets[0]
+        return (len(self._ranges) == 0 and len(other.ranges) != 0) or (
+            len(self._ranges) != 0
+            and len(other.ranges) != 0
+            and self.first < other.first
         )
 
-    @property
-    def name(self) -> str:
-        return self._name
+    def _element(self, index: int, value: int) -> Offset:
+        return Offset(str(index), HexStr.from_int(value))
 
     @property
-    def offsets(self) -> List[Offset]:
-        return self._offsets
+    def offsets(self) -> Iterator[Offset]:
+        for index, value in self.elements:
+            yield self._element(index, value)
 
     @property
-    def indexes(self) -> List[int]:
-        return [int(offset.name) for offset in self._offsets]
+    def groups(self) -> List[Offset]:
+        return self._groups
 
-    @property
-    def step(self) -> Optional[Tuple[HexStr, Optional[HexStr], Optional[int]]]:
-        if len(self._offsets) == 0:
-            return None
+    def append_group(self, group: Offset) -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Array({self._name}): already finalized")
 
-        if len(self._offsets) == 1:
-            return self._offsets[0].offset, None, None
+        self._groups.append(group)
 
-        start_index = int(self._offsets[0].name)
-        start_offset = self._offsets[0].offset.value
+    def finalize(self) -> None:
+        for group in self._groups:
+            group.finalize()
 
-        step = (self._offsets[1].offset.value - start_offset) / (
-            int(self._offsets[1].name) - start_index
-        )
+        self._groups.sort()
+        super().finalize()
 
-        if not step.is_integer() or step <= 0:
-            return None
 
-        step = int(step)
-        base = start_offset - (step * start_index)
+class Register:
+    __slots__ = ("_offset", "_group", "_array")
 
-        if any(
-            base != (offset.offset.value - (step * int(offset.name)))
-            for offset in self._offsets
-        ):
-            return None
+    def __init__(
+        self,
+        offset: Offset,
+        group: Offset,
+        array: Optional[Array] = None,
+    ) -> None:
+        self._offset: Offset = offset
+        self._group: Offset = group
+        self._array: Optional[Array] = array
+
+    def __lt__(self, other: "Register") -> bool:
+        return self._offset < other._offset
+
+    @property
+    def name(self) -> str:
+        return self._offset.name
+
+    @property
+    def offset(self) -> HexStr:
+        return self._offset.offset
+
+    @property
+    def group(self) -> Offset:
+        return self._group
+
+    @property
+    def array(self) -> Optional[Array]:
+        return self._array
 
+    @property
+    def keyword(self) -> str:
         return (
-            (HexStr.from_int(base), HexStr.from_int(step), step.bit_length() - 1)
-            if (step & (step - 1)) == 0
-            else (HexStr.from_int(base), HexStr.from_int(step), None)
+            self._offset.name
+            if self._array is None
+            else f"{self._array.name}_{self._group.name}"
         )
 
     @property
-    def groups(self) -> List[Offset]:
-        return self._groups
+    def fields(self) -> List["_Field"]:
+        return self._group.fields
 
-    def append_offset(self, offset: Offset) -> None:
-        self._offsets.append(offset)
-        self._offsets.sort()
+    @property
+    def opts(self) -> List[Opt]:
+        return self._group.opts
 
-    def append_group(self, group: Offset) -> None:
-        self._groups.append(group)
-        self._groups.sort()
+    @property
+    def bits(self) -> Optional[int]:
+        return (
+            32
+            if Opt.Bit32 in self._group.opts
+            else (64 if Opt.Bit64 in self._group.opts else None)
+        )
+
+    def width(self, bits: int) -> int:
+        return self.bits if self.bits is not None else bits
 
 
 class _Field:
+    __slots__ = (
+        "_name",
+        "_bits",
+        "_mask",
+        "_access",
+        "_reset",
+        "_enums",
+        "_finalized",
+    )
+
     def __init__(
         self,
         name: str,
@@ -671,16 +908,18 @@ class _Field:
         access: Optional[str],
         reset: Optional[str],
     ) -> None:
-        self._name: str = name
+        self._name: str = intern(name)
         self._bits: Tuple[int, int] = bits
-        self._access: Optional[str] = access
-        self._reset: Optional[Union[IntStr, HexStr]] = (
-            (IntStr(reset) if IntStr.is_IntStr(reset) else HexStr(reset))
+        self._mask: int = ((1 << (bits[0] - bits[1] + 1)) - 1) << bits[1]
+        self._access: Optional[str] = intern(access) if access is not None else None
+        self._reset: Optional[int] = (
+            (IntStr(reset) if IntStr.is_IntStr(reset) else HexStr(reset)).value
             if reset is not None
             else None
         )
 
         self._enums: List[_Enum] = []
+        self._finalized: bool = False
 
     def __lt__(self, other: "_Field") -> bool:
         return self.bits[1] < other.bits[1]
@@ -693,12 +932,16 @@ class _Field:
     def bits(self) -> Tuple[int, int]:
         return self._bits
 
+    @property
+    def mask(self) -> int:
+        return self._mask
+
     @property
     def access(self) -> Optional[str]:
         return self._access
 
     @property
-    def reset(self) -> Optional[Union[IntStr, HexStr]]:
+    def reset(self) -> Optional[int]:
         return self._reset
 
     @property
@@ -706,24 +949,30 @@ class _Field:
         return self._enums
 
     def append(self, enum: "_Enum") -> None:
+        if self._finalized:
+            raise NotExpectedError(f"Invalid, Field({self._name}): already finalized")
+
         self._enums.append(enum)
+
+    def finalize(self) -> None:
         self._enums.sort()
+        self._finalized = True
 
 
 class _Enum:
+    __slots__ = ("_name", "_val")
+
     def __init__(self, name: str, val: str) -> None:
-        self._name: str = name
-        self._val: Union[IntStr, HexStr] = (
-            IntStr(val) if IntStr.is_IntStr(val) else HexStr(val)
-        )
+        self._name: str = intern(name)
+        self._val: int = (IntStr(val) if IntStr.is_IntStr(val) else HexStr(val)).value
 
     def __lt__(self, other: "_Enum") -> bool:
-        return self.val.value < other.val.value
+        return self._val < other.val
 
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def val(self) -> Union[IntStr, HexStr]:
+    def val(self) -> int:
         return self._val
@@ -1,4 +1,7 @@
+from typing import Optional
+
 from inc.WriteFile import WriteFile
+from inc.SectionCache import SectionCache
 
 from src.Reg.RegGen import RegGen
 from src.Reg.RegConfig import RegConfig
@@ -11,5 +14,7 @@ class RegDoc(RegGen):
     def __init__(self, regdef: RegDef, config: RegConfig) -> None:
         raise NotImplementedError()
 
-    def generate(self, file: WriteFile) -> None:
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
         raise NotImplementedError()
@@ -1,6 +1,8 @@
+from typing import List, Optional
 from abc import ABC, abstractmethod
 
-from inc import WriteFile
+from infos import reggen_name, reggen_version
+from inc import ReadFile, WriteFile, SectionCache
 
 from src.Reg.RegConfig import RegConfig
 from src.Reg.RegDef import RegDef
@@ -14,5 +16,27 @@ class RegGen(ABC):
         pass
 
     @abstractmethod
-    def generate(self, file: WriteFile) -> None:
+    def generate(
+        self, file: WriteFile, sections: Optional[SectionCache] = None
+    ) -> None:
         pass
+
+    @classmethod
+    def fingerprint(cls, file: ReadFile, config: RegConfig) -> List[str]:
+        return [
+            "// Do not edit!",
+            f"// This is generated by {reggen_name} {reggen_version}",
+            f"// RegDef hash({file.hash})",
+            f"// Config hash({config.fingerprint(cls.__name__)})",
+        ]
+
+    @classmethod
+    def fresh(cls, file: WriteFile, source: ReadFile, config: RegConfig) -> bool:
+        return file.starts_with(cls.fingerprint(source, config))
+
+    @classmethod
+    def section_cache(cls, file: WriteFile, config: RegConfig) -> SectionCache:
+        return SectionCache(
+            file.path,
+            f"{reggen_version} {config.fingerprint(cls.__name__)}",
+        )
@@ -0,0 +1,45 @@
+from time import perf_counter
+from unittest import TestCase, main
+
+from inc import IntervalIndex
+
+
+class TestIntervalIndex(TestCase):
+    def test_many_groups(self) -> None:
+        index = IntervalIndex()
+
+        for group in range(128):
+            start = 0x1000 + 4 * group
+            index.append_progression(start, start + 4, group, 0x400, 4096)
+
+        begin = perf_counter()
+        pairs = index.overlaps()
+
+        self.assertEqual(pairs, [])
+        self.assertLess(perf_counter() - begin, 1.0)
+
+    def test_colliding_groups(self) -> None:
+        index = IntervalIndex()
+        index.append_progression(0x100, 0x108, "A", 0x40, 4)
+        index.append_progression(0x144, 0x148, "B", 0x40, 4)
+
+        self.assertEqual(
+            [(a[1], b[1]) for a, b in index.overlaps()], [(1, 0), (2, 1), (3, 2)]
+        )
+
+    def test_self_overlap(self) -> None:
+        index = IntervalIndex()
+        index.append_progression(0x0, 0x8, "A", 0x4, 3)
+
+        self.assertEqual([(a[1], b[1]) for a, b in index.overlaps()], [(0, 1), (1, 2)])
+
+    def test_different_steps(self) -> None:
+        index = IntervalIndex()
+        index.append_progression(0x0, 0x4, "A", 0x10, 4)
+        index.append_progression(0x20, 0x24, "B", 0x20, 2)
+
+        self.assertEqual([(a[1], b[1]) for a, b in index.overlaps()], [(2, 0)])
+
+
+if __name__ == "__main__":
+    main()